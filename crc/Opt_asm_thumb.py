@@ -71,6 +71,28 @@ def _crc32_tr(r0, r1, r2, r3) -> uint:
     sub(r2, 1)         # n -= 1
     bne(loop)          # --- test and outer end ---
 
+# the same, with the register kept in crc[0] (ptr32) between the calls, so nothing is allocated for the result
+# r0 .. crc (ptr32), the register while running
+@micropython.asm_thumb
+def _crc32_h(r0, r1, r2, r3):
+    push({r0})
+    ldr(r0, [r0, 0])   # crc
+    mov(r6, 0xff)
+    label(loop)
+    ldrb(r5, [r1, 0])  # idx = data[0]
+    add(r1, 1)         # increment data pointer
+    eor(r5, r0)        # idx ^= crc
+    and_(r5, r6)       # idx ^= 0xff
+    lsl(r5, r5, 2)     # * 4 to make idx ptr32            <-- difference for 32 vs 16 bit
+    add(r5, r5, r3)    # table data address
+    ldr(r5, [r5, 0])   # fetch table entry: r5 = tab[idx] <-- difference for 32 vs 16 bit
+    lsr(r0, r0, 8)     # crc >>= 8
+    eor(r0, r5)        # crc ^= tab[idx]
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+    pop({r4})
+    str(r0, [r4, 0])   # back to crc[0]
+
 # --- internal ---
 # r7 .. working register
 # r6 .. idx or tab[idx]
@@ -108,17 +130,940 @@ def _crc64_h(r0, r1, r2, r3):  # just a helper function
     str(r4, [r0, 0])        # crc0
     str(r5, [r0, 4])        # crc1, higher word of crc
 
-from array import array
-acrc = array('Q', (0,))
+from array import array     # each call passes the crc in an array of its own, so the wrappers are reentrant (threads)
 
 def _crc64_tr(crc, data, n, tab):
-    acrc[0] = crc
+    acrc = array('Q', (crc,))
     _crc64_h(acrc, data, n, tab)
     return acrc[0]
 
+# --- slicing-by-4 and slicing-by-8 versions ---
+#
+# The bytes of a block are processed from the last to the first, so the table pointer r6 only has to
+# be advanced by the table stride from T0 to T1, T2, ..
+#
+# --- internal ---
+# r7 .. table stride (256 entries)
+# r6 .. pointer to current table Tk
+# r5 .. idx or tab[idx]
+# r4 .. new crc, accumulated
+# --- arguments ---
+# r3 .. lookup table address
+# r2 .. n (number of blocks)
+# r1 .. data address
+# r0 .. crc, then crc ^ data
+@micropython.asm_thumb
+def _crc8_ts4(r0, r1, r2, r3) -> uint:
+    mov(r7, 1)
+    lsl(r7, r7, 8)     # stride 256
+    label(loop)
+    ldrb(r5, [r1, 0])
+    eor(r0, r5)        # x = crc ^ data[0]
+    ldrb(r5, [r1, 3])  # T0[data[3]]
+    add(r5, r5, r3)
+    ldrb(r4, [r5, 0])
+    add(r6, r3, r7)    # T1[data[2]]
+    ldrb(r5, [r1, 2])
+    add(r5, r5, r6)
+    ldrb(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T2[data[1]]
+    ldrb(r5, [r1, 1])
+    add(r5, r5, r6)
+    ldrb(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T3[x]
+    add(r5, r0, r6)
+    ldrb(r0, [r5, 0])
+    eor(r0, r4)        # crc = T3[x] ^ T2[..] ^ ..
+    add(r1, 4)         # increment data pointer
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc8_ts8(r0, r1, r2, r3) -> uint:
+    mov(r7, 1)
+    lsl(r7, r7, 8)     # stride 256
+    label(loop)
+    ldrb(r5, [r1, 0])
+    eor(r0, r5)        # x = crc ^ data[0]
+    ldrb(r5, [r1, 7])  # T0[data[7]]
+    add(r5, r5, r3)
+    ldrb(r4, [r5, 0])
+    add(r6, r3, r7)    # T1[data[6]]
+    ldrb(r5, [r1, 6])
+    add(r5, r5, r6)
+    ldrb(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T2[data[5]]
+    ldrb(r5, [r1, 5])
+    add(r5, r5, r6)
+    ldrb(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T3[data[4]]
+    ldrb(r5, [r1, 4])
+    add(r5, r5, r6)
+    ldrb(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T4[data[3]]
+    ldrb(r5, [r1, 3])
+    add(r5, r5, r6)
+    ldrb(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T5[data[2]]
+    ldrb(r5, [r1, 2])
+    add(r5, r5, r6)
+    ldrb(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T6[data[1]]
+    ldrb(r5, [r1, 1])
+    add(r5, r5, r6)
+    ldrb(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T7[x]
+    add(r5, r0, r6)
+    ldrb(r0, [r5, 0])
+    eor(r0, r4)        # crc = T7[x] ^ T6[..] ^ ..
+    add(r1, 8)         # increment data pointer
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc16_ts4(r0, r1, r2, r3) -> uint:
+    mov(r7, 1)
+    lsl(r7, r7, 9)     # stride 256 * 2
+    label(loop)
+    ldrb(r5, [r1, 0])
+    eor(r0, r5)
+    ldrb(r5, [r1, 1])
+    lsl(r5, r5, 8)
+    eor(r0, r5)        # x = crc ^ data[0] ^ data[1] << 8
+    ldrb(r5, [r1, 3])  # T0[data[3]]
+    lsl(r5, r5, 1)
+    add(r5, r5, r3)
+    ldrh(r4, [r5, 0])
+    add(r6, r3, r7)    # T1[data[2]]
+    ldrb(r5, [r1, 2])
+    lsl(r5, r5, 1)
+    add(r5, r5, r6)
+    ldrh(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T2[x >> 8]
+    lsr(r5, r0, 8)
+    lsl(r5, r5, 1)
+    add(r5, r5, r6)
+    ldrh(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T3[x & 0xff]
+    lsl(r5, r0, 24)
+    lsr(r5, r5, 23)
+    add(r5, r5, r6)
+    ldrh(r0, [r5, 0])
+    eor(r0, r4)        # crc = T3[..] ^ T2[..] ^ ..
+    add(r1, 4)         # increment data pointer
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc16_ts8(r0, r1, r2, r3) -> uint:
+    mov(r7, 1)
+    lsl(r7, r7, 9)     # stride 256 * 2
+    label(loop)
+    ldrb(r5, [r1, 0])
+    eor(r0, r5)
+    ldrb(r5, [r1, 1])
+    lsl(r5, r5, 8)
+    eor(r0, r5)        # x = crc ^ data[0] ^ data[1] << 8
+    ldrb(r5, [r1, 7])  # T0[data[7]]
+    lsl(r5, r5, 1)
+    add(r5, r5, r3)
+    ldrh(r4, [r5, 0])
+    add(r6, r3, r7)    # T1[data[6]]
+    ldrb(r5, [r1, 6])
+    lsl(r5, r5, 1)
+    add(r5, r5, r6)
+    ldrh(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T2[data[5]]
+    ldrb(r5, [r1, 5])
+    lsl(r5, r5, 1)
+    add(r5, r5, r6)
+    ldrh(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T3[data[4]]
+    ldrb(r5, [r1, 4])
+    lsl(r5, r5, 1)
+    add(r5, r5, r6)
+    ldrh(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T4[data[3]]
+    ldrb(r5, [r1, 3])
+    lsl(r5, r5, 1)
+    add(r5, r5, r6)
+    ldrh(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T5[data[2]]
+    ldrb(r5, [r1, 2])
+    lsl(r5, r5, 1)
+    add(r5, r5, r6)
+    ldrh(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T6[x >> 8]
+    lsr(r5, r0, 8)
+    lsl(r5, r5, 1)
+    add(r5, r5, r6)
+    ldrh(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T7[x & 0xff]
+    lsl(r5, r0, 24)
+    lsr(r5, r5, 23)
+    add(r5, r5, r6)
+    ldrh(r0, [r5, 0])
+    eor(r0, r4)        # crc = T7[..] ^ T6[..] ^ ..
+    add(r1, 8)         # increment data pointer
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc32_ts4(r0, r1, r2, r3) -> uint:
+    mov(r7, 1)
+    lsl(r7, r7, 10)    # stride 256 * 4
+    label(loop)
+    ldrb(r5, [r1, 0])
+    eor(r0, r5)
+    ldrb(r5, [r1, 1])
+    lsl(r5, r5, 8)
+    eor(r0, r5)
+    ldrb(r5, [r1, 2])
+    lsl(r5, r5, 16)
+    eor(r0, r5)
+    ldrb(r5, [r1, 3])
+    lsl(r5, r5, 24)
+    eor(r0, r5)        # x = crc ^ data[0..3] (little endian)
+    lsr(r5, r0, 24)    # T0[x >> 24]
+    lsl(r5, r5, 2)
+    add(r5, r5, r3)
+    ldr(r4, [r5, 0])
+    add(r6, r3, r7)    # T1[(x >> 16) & 0xff]
+    lsl(r5, r0, 8)
+    lsr(r5, r5, 24)
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T2[(x >> 8) & 0xff]
+    lsl(r5, r0, 16)
+    lsr(r5, r5, 24)
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T3[x & 0xff]
+    lsl(r5, r0, 24)
+    lsr(r5, r5, 22)
+    add(r5, r5, r6)
+    ldr(r0, [r5, 0])
+    eor(r0, r4)        # crc = T3[..] ^ T2[..] ^ ..
+    add(r1, 4)         # increment data pointer
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc32_ts8(r0, r1, r2, r3) -> uint:
+    mov(r7, 1)
+    lsl(r7, r7, 10)    # stride 256 * 4
+    label(loop)
+    ldrb(r5, [r1, 0])
+    eor(r0, r5)
+    ldrb(r5, [r1, 1])
+    lsl(r5, r5, 8)
+    eor(r0, r5)
+    ldrb(r5, [r1, 2])
+    lsl(r5, r5, 16)
+    eor(r0, r5)
+    ldrb(r5, [r1, 3])
+    lsl(r5, r5, 24)
+    eor(r0, r5)        # x = crc ^ data[0..3] (little endian)
+    ldrb(r5, [r1, 7])  # T0[data[7]]
+    lsl(r5, r5, 2)
+    add(r5, r5, r3)
+    ldr(r4, [r5, 0])
+    add(r6, r3, r7)    # T1[data[6]]
+    ldrb(r5, [r1, 6])
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T2[data[5]]
+    ldrb(r5, [r1, 5])
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T3[data[4]]
+    ldrb(r5, [r1, 4])
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T4[x >> 24]
+    lsr(r5, r0, 24)
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T5[(x >> 16) & 0xff]
+    lsl(r5, r0, 8)
+    lsr(r5, r5, 24)
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T6[(x >> 8) & 0xff]
+    lsl(r5, r0, 16)
+    lsr(r5, r5, 24)
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T7[x & 0xff]
+    lsl(r5, r0, 24)
+    lsr(r5, r5, 22)
+    add(r5, r5, r6)
+    ldr(r0, [r5, 0])
+    eor(r0, r4)        # crc = T7[..] ^ T6[..] ^ ..
+    add(r1, 8)         # increment data pointer
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+
+# the same, with the register kept in crc[0] (ptr32)
+@micropython.asm_thumb
+def _crc32_hs4(r0, r1, r2, r3):
+    push({r0})
+    ldr(r0, [r0, 0])   # crc
+    mov(r7, 1)
+    lsl(r7, r7, 10)    # stride 256 * 4
+    label(loop)
+    ldrb(r5, [r1, 0])
+    eor(r0, r5)
+    ldrb(r5, [r1, 1])
+    lsl(r5, r5, 8)
+    eor(r0, r5)
+    ldrb(r5, [r1, 2])
+    lsl(r5, r5, 16)
+    eor(r0, r5)
+    ldrb(r5, [r1, 3])
+    lsl(r5, r5, 24)
+    eor(r0, r5)        # x = crc ^ data[0..3] (little endian)
+    lsr(r5, r0, 24)    # T0[x >> 24]
+    lsl(r5, r5, 2)
+    add(r5, r5, r3)
+    ldr(r4, [r5, 0])
+    add(r6, r3, r7)    # T1[(x >> 16) & 0xff]
+    lsl(r5, r0, 8)
+    lsr(r5, r5, 24)
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T2[(x >> 8) & 0xff]
+    lsl(r5, r0, 16)
+    lsr(r5, r5, 24)
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T3[x & 0xff]
+    lsl(r5, r0, 24)
+    lsr(r5, r5, 22)
+    add(r5, r5, r6)
+    ldr(r0, [r5, 0])
+    eor(r0, r4)        # crc = T3[..] ^ T2[..] ^ ..
+    add(r1, 4)         # increment data pointer
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+    pop({r4})
+    str(r0, [r4, 0])   # back to crc[0]
+
+@micropython.asm_thumb
+def _crc32_hs8(r0, r1, r2, r3):
+    push({r0})
+    ldr(r0, [r0, 0])   # crc
+    mov(r7, 1)
+    lsl(r7, r7, 10)    # stride 256 * 4
+    label(loop)
+    ldrb(r5, [r1, 0])
+    eor(r0, r5)
+    ldrb(r5, [r1, 1])
+    lsl(r5, r5, 8)
+    eor(r0, r5)
+    ldrb(r5, [r1, 2])
+    lsl(r5, r5, 16)
+    eor(r0, r5)
+    ldrb(r5, [r1, 3])
+    lsl(r5, r5, 24)
+    eor(r0, r5)        # x = crc ^ data[0..3] (little endian)
+    ldrb(r5, [r1, 7])  # T0[data[7]]
+    lsl(r5, r5, 2)
+    add(r5, r5, r3)
+    ldr(r4, [r5, 0])
+    add(r6, r3, r7)    # T1[data[6]]
+    ldrb(r5, [r1, 6])
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T2[data[5]]
+    ldrb(r5, [r1, 5])
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T3[data[4]]
+    ldrb(r5, [r1, 4])
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T4[x >> 24]
+    lsr(r5, r0, 24)
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T5[(x >> 16) & 0xff]
+    lsl(r5, r0, 8)
+    lsr(r5, r5, 24)
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T6[(x >> 8) & 0xff]
+    lsl(r5, r0, 16)
+    lsr(r5, r5, 24)
+    lsl(r5, r5, 2)
+    add(r5, r5, r6)
+    ldr(r5, [r5, 0])
+    eor(r4, r5)
+    add(r6, r6, r7)    # T7[x & 0xff]
+    lsl(r5, r0, 24)
+    lsr(r5, r5, 22)
+    add(r5, r5, r6)
+    ldr(r0, [r5, 0])
+    eor(r0, r4)        # crc = T7[..] ^ T6[..] ^ ..
+    add(r1, 8)         # increment data pointer
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+    pop({r4})
+    str(r0, [r4, 0])   # back to crc[0]
+
+# --- internal ---
+# r7 .. pointer to current table Tk
+# r6 .. idx
+# r5 .. crc1, accumulated
+# r4 .. crc0, accumulated
+# r2 .. working register
+# --- arguments ---
+# r3 .. lookup table address
+# r2 .. n, kept in crc[2] (r2 is needed as working register)
+# r1 .. data address
+# r0 .. crc (ptr64) followed by room for n and the table stride (ptr32), its bytes are xored with the data bytes
+@micropython.asm_thumb
+def _crc64_hs4(r0, r1, r2, r3):  # just a helper function
+    str(r2, [r0, 8])   # n
+    mov(r2, 1)
+    lsl(r2, r2, 11)
+    str(r2, [r0, 12])  # table stride 256 * 8
+    label(loop)
+    mov(r4, 0)
+    mov(r5, 0)
+    mov(r7, r3)        # T0
+    ldrb(r6, [r1, 3])  # T0[crc[3] ^ data[3]]
+    ldrb(r2, [r0, 3])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 12])  # T1[crc[2] ^ data[2]]
+    add(r7, r7, r2)
+    ldrb(r6, [r1, 2])
+    ldrb(r2, [r0, 2])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 12])  # T2[crc[1] ^ data[1]]
+    add(r7, r7, r2)
+    ldrb(r6, [r1, 1])
+    ldrb(r2, [r0, 1])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 12])  # T3[crc[0] ^ data[0]]
+    add(r7, r7, r2)
+    ldrb(r6, [r1, 0])
+    ldrb(r2, [r0, 0])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 4])   # crc0 = (crc >> 32) ^ ..
+    eor(r4, r2)
+    str(r4, [r0, 0])   # crc0
+    str(r5, [r0, 4])   # crc1
+    add(r1, 4)         # increment data pointer
+    ldr(r2, [r0, 8])
+    sub(r2, 1)         # n -= 1
+    str(r2, [r0, 8])
+    bne(loop)          # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc64_hs8(r0, r1, r2, r3):  # just a helper function
+    str(r2, [r0, 8])   # n
+    mov(r2, 1)
+    lsl(r2, r2, 11)
+    str(r2, [r0, 12])  # table stride 256 * 8
+    label(loop)
+    mov(r4, 0)
+    mov(r5, 0)
+    mov(r7, r3)        # T0
+    ldrb(r6, [r1, 7])  # T0[crc[7] ^ data[7]]
+    ldrb(r2, [r0, 7])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 12])  # T1[crc[6] ^ data[6]]
+    add(r7, r7, r2)
+    ldrb(r6, [r1, 6])
+    ldrb(r2, [r0, 6])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 12])  # T2[crc[5] ^ data[5]]
+    add(r7, r7, r2)
+    ldrb(r6, [r1, 5])
+    ldrb(r2, [r0, 5])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 12])  # T3[crc[4] ^ data[4]]
+    add(r7, r7, r2)
+    ldrb(r6, [r1, 4])
+    ldrb(r2, [r0, 4])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 12])  # T4[crc[3] ^ data[3]]
+    add(r7, r7, r2)
+    ldrb(r6, [r1, 3])
+    ldrb(r2, [r0, 3])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 12])  # T5[crc[2] ^ data[2]]
+    add(r7, r7, r2)
+    ldrb(r6, [r1, 2])
+    ldrb(r2, [r0, 2])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 12])  # T6[crc[1] ^ data[1]]
+    add(r7, r7, r2)
+    ldrb(r6, [r1, 1])
+    ldrb(r2, [r0, 1])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    ldr(r2, [r0, 12])  # T7[crc[0] ^ data[0]]
+    add(r7, r7, r2)
+    ldrb(r6, [r1, 0])
+    ldrb(r2, [r0, 0])
+    eor(r6, r2)
+    lsl(r6, r6, 3)
+    add(r6, r6, r7)
+    ldr(r2, [r6, 0])
+    eor(r4, r2)
+    ldr(r2, [r6, 4])
+    eor(r5, r2)
+    str(r4, [r0, 0])   # crc0
+    str(r5, [r0, 4])   # crc1
+    add(r1, 8)         # increment data pointer
+    ldr(r2, [r0, 8])
+    sub(r2, 1)         # n -= 1
+    str(r2, [r0, 8])
+    bne(loop)          # --- test and outer end ---
+
+def _crc64_ts4(crc, data, n, tab):
+    acrc = array('Q', (crc, 0))   # crc, room for n and the table stride
+    _crc64_hs4(acrc, data, n, tab)
+    return acrc[0]
+
+def _crc64_ts8(crc, data, n, tab):
+    acrc = array('Q', (crc, 0))   # crc, room for n and the table stride
+    _crc64_hs8(acrc, data, n, tab)
+    return acrc[0]
+
+# --- digest of several buffers, one after the other, see Calculator.digest_iov() ---
+#
+# --- internal ---
+# r7 .. number of buffers, used for the outer loop
+# r6 .. 0xff
+# r5 .. idx or tab[idx]
+# r4 .. iov pointer
+# --- arguments ---
+# r3 .. lookup table address
+# r2 .. m (number of buffers, > 0), then length of the buffer
+# r1 .. iov (ptr32): address and length of each buffer; then data address
+# r0 .. crc
+@micropython.asm_thumb
+def _crc8_ti(r0, r1, r2, r3) -> uint:
+    mov(r4, r1)        # iov pointer
+    mov(r7, r2)        # number of buffers
+    label(buffer)
+    ldr(r1, [r4, 0])   # data address
+    ldr(r2, [r4, 4])   # length
+    add(r4, 8)
+    cmp(r2, 0)
+    beq(skip)
+    label(loop)
+    ldrb(r5, [r1, 0])  # idx = data[0]
+    add(r1, 1)         # increment data pointer
+    eor(r5, r0)        # idx ^= crc
+    add(r5, r5, r3)    # table data address
+    ldrb(r0, [r5, 0])  # fetch table entry: r0 = tab[idx]
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and end of buffer ---
+    label(skip)
+    sub(r7, 1)         # buffers -= 1
+    bne(buffer)        # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc16_ti(r0, r1, r2, r3) -> uint:
+    mov(r4, r1)        # iov pointer
+    mov(r7, r2)        # number of buffers
+    mov(r6, 0xff)
+    label(buffer)
+    ldr(r1, [r4, 0])   # data address
+    ldr(r2, [r4, 4])   # length
+    add(r4, 8)
+    cmp(r2, 0)
+    beq(skip)
+    label(loop)
+    ldrb(r5, [r1, 0])  # idx = data[0]
+    add(r1, 1)         # increment data pointer
+    eor(r5, r0)        # idx ^= crc
+    and_(r5, r6)       # idx &= 0xff
+    lsl(r5, r5, 1)     # make idx ptr16
+    add(r5, r5, r3)    # table data address
+    ldrh(r5, [r5, 0])   # fetch table entry: r5 = tab[idx]
+    lsr(r0, r0, 8)     # crc >>= 8
+    eor(r0, r5)        # crc ^= tab[idx]
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and end of buffer ---
+    label(skip)
+    sub(r7, 1)         # buffers -= 1
+    bne(buffer)        # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc32_ti(r0, r1, r2, r3) -> uint:
+    mov(r4, r1)        # iov pointer
+    mov(r7, r2)        # number of buffers
+    mov(r6, 0xff)
+    label(buffer)
+    ldr(r1, [r4, 0])   # data address
+    ldr(r2, [r4, 4])   # length
+    add(r4, 8)
+    cmp(r2, 0)
+    beq(skip)
+    label(loop)
+    ldrb(r5, [r1, 0])  # idx = data[0]
+    add(r1, 1)         # increment data pointer
+    eor(r5, r0)        # idx ^= crc
+    and_(r5, r6)       # idx &= 0xff
+    lsl(r5, r5, 2)     # make idx ptr32
+    add(r5, r5, r3)    # table data address
+    ldr(r5, [r5, 0])   # fetch table entry: r5 = tab[idx]
+    lsr(r0, r0, 8)     # crc >>= 8
+    eor(r0, r5)        # crc ^= tab[idx]
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and end of buffer ---
+    label(skip)
+    sub(r7, 1)         # buffers -= 1
+    bne(buffer)        # --- test and outer end ---
+
+# --- copy and digest in one loop, see Calculator.digest_into() ---
+#
+# --- internal ---
+# r6 .. 0xff
+# r5 .. idx or tab[idx]
+# r4 .. destination address
+# --- arguments ---
+# r3 .. ctl (ptr32): lookup table address, destination address; then lookup table address
+# r2 .. n (length of data)
+# r1 .. data address
+# r0 .. crc
+@micropython.asm_thumb
+def _crc8_tc(r0, r1, r2, r3) -> uint:
+    ldr(r4, [r3, 4])   # destination address
+    ldr(r3, [r3, 0])   # lookup table address
+    label(loop)
+    ldrb(r5, [r1, 0])  # idx = data[0]
+    add(r1, 1)         # increment data pointer
+    strb(r5, [r4, 0])  # copy it
+    add(r4, 1)         # increment destination pointer
+    eor(r5, r0)        # idx ^= crc
+    add(r5, r5, r3)    # table data address
+    ldrb(r0, [r5, 0])  # fetch table entry: r0 = tab[idx]
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc16_tc(r0, r1, r2, r3) -> uint:
+    ldr(r4, [r3, 4])   # destination address
+    ldr(r3, [r3, 0])   # lookup table address
+    mov(r6, 0xff)
+    label(loop)
+    ldrb(r5, [r1, 0])  # idx = data[0]
+    add(r1, 1)         # increment data pointer
+    strb(r5, [r4, 0])  # copy it
+    add(r4, 1)         # increment destination pointer
+    eor(r5, r0)        # idx ^= crc
+    and_(r5, r6)       # idx &= 0xff
+    lsl(r5, r5, 1)     # double to make idx ptr16
+    add(r5, r5, r3)    # table data address
+    ldrh(r5, [r5, 0])  # fetch table entry: r5 = tab[idx]
+    lsr(r0, r0, 8)     # crc >>= 8
+    eor(r0, r5)        # crc ^= tab[idx]
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc32_tc(r0, r1, r2, r3) -> uint:
+    ldr(r4, [r3, 4])   # destination address
+    ldr(r3, [r3, 0])   # lookup table address
+    mov(r6, 0xff)
+    label(loop)
+    ldrb(r5, [r1, 0])  # idx = data[0]
+    add(r1, 1)         # increment data pointer
+    strb(r5, [r4, 0])  # copy it
+    add(r4, 1)         # increment destination pointer
+    eor(r5, r0)        # idx ^= crc
+    and_(r5, r6)       # idx &= 0xff
+    lsl(r5, r5, 2)     # * 4 to make idx ptr32
+    add(r5, r5, r3)    # table data address
+    ldr(r5, [r5, 0])   # fetch table entry: r5 = tab[idx]
+    lsr(r0, r0, 8)     # crc >>= 8
+    eor(r0, r5)        # crc ^= tab[idx]
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and outer end ---
+
+# --- batch versions: crcs of many frames in one buffer ---
+#
+# --- internal ---
+# r7 .. ctl
+# r6 .. 0xff
+# r5 .. idx or tab[idx], working register
+# r4 .. number of frames, used for the outer loop
+# --- arguments ---
+# r3 .. lookup table address
+# r2 .. n (number of frames), then length of the frame
+# r1 .. data buffer address, then data address of the frame
+# r0 .. ctl (ptr32): initial register, xorout (register form), byte swap flag, shift,
+#       address of offsets (ptr32), address of lengths (ptr32), address of out (crc storage size),
+#       data buffer address (set here); then crc
+@micropython.asm_thumb
+def _crc8_tp(r0, r1, r2, r3):
+    mov(r7, r0)        # ctl
+    str(r1, [r7, 28])  # data buffer address
+    mov(r4, r2)        # number of frames
+    label(frame)
+    ldr(r5, [r7, 16])  # offsets pointer
+    ldr(r1, [r5, 0])   # offset
+    add(r5, 4)
+    str(r5, [r7, 16])
+    ldr(r5, [r7, 28])
+    add(r1, r1, r5)    # data address of the frame
+    ldr(r5, [r7, 20])  # lengths pointer
+    ldr(r2, [r5, 0])   # length
+    add(r5, 4)
+    str(r5, [r7, 20])
+    ldr(r0, [r7, 0])   # crc = initial register
+    mov(r6, 0xff)
+    cmp(r2, 0)
+    beq(fin)
+    label(loop)
+    ldrb(r5, [r1, 0])  # idx = data[0]
+    add(r1, 1)         # increment data pointer
+    eor(r5, r0)        # idx ^= crc
+    add(r5, r5, r3)    # table data address
+    ldrb(r0, [r5, 0])  # fetch table entry: r0 = tab[idx]
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and end of frame ---
+    label(fin)
+    ldr(r5, [r7, 4])   # crc ^= xorout
+    eor(r0, r5)
+    ldr(r5, [r7, 12])  # crc >>= shift
+    lsr(r0, r5)
+    ldr(r5, [r7, 24])  # out pointer
+    strb(r0, [r5, 0])
+    add(r5, 1)
+    str(r5, [r7, 24])
+    sub(r4, 1)         # frames -= 1
+    bne(frame)         # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc16_tp(r0, r1, r2, r3):
+    mov(r7, r0)        # ctl
+    str(r1, [r7, 28])  # data buffer address
+    mov(r4, r2)        # number of frames
+    label(frame)
+    ldr(r5, [r7, 16])  # offsets pointer
+    ldr(r1, [r5, 0])   # offset
+    add(r5, 4)
+    str(r5, [r7, 16])
+    ldr(r5, [r7, 28])
+    add(r1, r1, r5)    # data address of the frame
+    ldr(r5, [r7, 20])  # lengths pointer
+    ldr(r2, [r5, 0])   # length
+    add(r5, 4)
+    str(r5, [r7, 20])
+    ldr(r0, [r7, 0])   # crc = initial register
+    mov(r6, 0xff)
+    cmp(r2, 0)
+    beq(fin)
+    label(loop)
+    ldrb(r5, [r1, 0])  # idx = data[0]
+    add(r1, 1)         # increment data pointer
+    eor(r5, r0)        # idx ^= crc
+    and_(r5, r6)       # idx &= 0xff
+    lsl(r5, r5, 1)     # make idx ptr16
+    add(r5, r5, r3)    # table data address
+    ldrh(r5, [r5, 0])  # fetch table entry: r5 = tab[idx]
+    lsr(r0, r0, 8)     # crc >>= 8
+    eor(r0, r5)        # crc ^= tab[idx]
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and end of frame ---
+    label(fin)
+    ldr(r5, [r7, 4])   # crc ^= xorout
+    eor(r0, r5)
+    ldr(r5, [r7, 8])   # swap bytes?
+    cmp(r5, 0)
+    beq(noswap)
+    lsl(r5, r0, 8)
+    lsr(r0, r0, 8)
+    orr(r0, r5)
+    lsl(r0, r0, 16)
+    lsr(r0, r0, 16)
+    label(noswap)
+    ldr(r5, [r7, 12])  # crc >>= shift
+    lsr(r0, r5)
+    ldr(r5, [r7, 24])  # out pointer
+    strh(r0, [r5, 0])
+    add(r5, 2)
+    str(r5, [r7, 24])
+    sub(r4, 1)         # frames -= 1
+    bne(frame)         # --- test and outer end ---
+
+@micropython.asm_thumb
+def _crc32_tp(r0, r1, r2, r3):
+    mov(r7, r0)        # ctl
+    str(r1, [r7, 28])  # data buffer address
+    mov(r4, r2)        # number of frames
+    label(frame)
+    ldr(r5, [r7, 16])  # offsets pointer
+    ldr(r1, [r5, 0])   # offset
+    add(r5, 4)
+    str(r5, [r7, 16])
+    ldr(r5, [r7, 28])
+    add(r1, r1, r5)    # data address of the frame
+    ldr(r5, [r7, 20])  # lengths pointer
+    ldr(r2, [r5, 0])   # length
+    add(r5, 4)
+    str(r5, [r7, 20])
+    ldr(r0, [r7, 0])   # crc = initial register
+    mov(r6, 0xff)
+    cmp(r2, 0)
+    beq(fin)
+    label(loop)
+    ldrb(r5, [r1, 0])  # idx = data[0]
+    add(r1, 1)         # increment data pointer
+    eor(r5, r0)        # idx ^= crc
+    and_(r5, r6)       # idx &= 0xff
+    lsl(r5, r5, 2)     # make idx ptr32
+    add(r5, r5, r3)    # table data address
+    ldr(r5, [r5, 0])   # fetch table entry: r5 = tab[idx]
+    lsr(r0, r0, 8)     # crc >>= 8
+    eor(r0, r5)        # crc ^= tab[idx]
+    sub(r2, 1)         # n -= 1
+    bne(loop)          # --- test and end of frame ---
+    label(fin)
+    ldr(r5, [r7, 4])   # crc ^= xorout
+    eor(r0, r5)
+    ldr(r5, [r7, 8])   # swap bytes?
+    cmp(r5, 0)
+    beq(noswap)
+    lsl(r5, r0, 24)    # byte 0 -> 3
+    lsr(r2, r0, 24)    # byte 3 -> 0
+    orr(r5, r2)
+    lsr(r2, r0, 8)     # byte 2 -> 1
+    lsl(r6, r6, 8)     # 0xff00
+    and_(r2, r6)
+    orr(r5, r2)
+    lsl(r2, r0, 8)     # byte 1 -> 2
+    lsl(r6, r6, 8)     # 0xff0000
+    and_(r2, r6)
+    orr(r5, r2)
+    mov(r0, r5)
+    label(noswap)
+    ldr(r5, [r7, 12])  # crc >>= shift
+    lsr(r0, r5)
+    ldr(r5, [r7, 24])  # out pointer
+    str(r0, [r5, 0])
+    add(r5, 4)
+    str(r5, [r7, 24])
+    sub(r4, 1)         # frames -= 1
+    bne(frame)         # --- test and outer end ---
+
 import crc
-crc.Implementation = 'asm_thumb'
-crc._crc8_tr  = _crc8_tr
-crc._crc16_tr = _crc16_tr
-crc._crc32_tr = _crc32_tr
-crc._crc64_tr = _crc64_tr
\ No newline at end of file
+crc._register('asm_thumb', globals(), True)   # this becomes the default implementation
\ No newline at end of file
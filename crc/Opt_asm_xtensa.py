@@ -68,6 +68,27 @@ def _crc32_tr(a2, a3, a4, a5) -> uint:
     xor(a2, a2, a6)    # crc ^= tab[idx]
     bne(a3, a4, loop)  # --- test and outer end ---
 
+# the same, with the register kept in crc[0] (ptr32) between the calls, so nothing is allocated for the result
+# a12 .. crc
+# a2 .. crc (ptr32)
+@micropython.asm_xtensa
+def _crc32_h(a2, a3, a4, a5):
+    l32i(a12, a2, 0)   # crc
+    movi(a7, 0xff)
+    add(a4, a4, a3)    # final data address
+    label(loop)
+    l8ui(a6, a3, 0)    # a6 = idx = data[0]
+    addi(a3, a3, 1)    # increment data pointer
+    xor(a6, a6, a12)   # idx ^= crc
+    and_(a6, a6, a7)   # idx &= 0xff
+    data(3, 0x110000 | 6<<12 | 6<<8 | (16-2)<<4) # slli(a6, a6, 2)  # a6 <<= 2  #  idx *= 4 to make idx ptr32
+    add(a6, a6, a5)    # table data address
+    l32i(a6, a6, 0)    # fetch table entry: a6 = tab[idx]
+    data(3, 0x410000 | 12<<12 | 12<<4 | 8<<8)   # srli(a12, a12, 8)   # a12 >>= 8  # crc >>= 8
+    xor(a12, a12, a6)  # crc ^= tab[idx]
+    bne(a3, a4, loop)  # --- test and outer end ---
+    s32i(a12, a2, 0)   # back to crc[0]
+
 # --- internal ---   # a2..a7, a12..a15 avail.
 # a14 .. 0xff
 # a13 .. working register
@@ -105,17 +126,12 @@ def _crc64_h(a2, a3, a4, a5):
     s32i(a7, a2, 4)        # crc1, higher word of crc
 
 
-from array import array
-acrc = array('Q', (0,))
+from array import array     # each call passes the crc in an array of its own, so the wrappers are reentrant (threads)
 
 def _crc64_tr(crc, data, n, tab):
-    acrc[0] = crc
+    acrc = array('Q', (crc,))
     _crc64_h(acrc, data, n, tab)
     return acrc[0]
 
 import crc
-crc.Implementation = 'asm_xtensa'
-crc._crc8_tr  = _crc8_tr
-crc._crc16_tr = _crc16_tr
-crc._crc32_tr = _crc32_tr
-crc._crc64_tr = _crc64_tr
\ No newline at end of file
+crc._register('asm_xtensa', globals(), True)   # this becomes the default implementation
\ No newline at end of file
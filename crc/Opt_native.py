@@ -24,9 +24,7 @@ def _crc16_tr(crc, data, n, tab):
         crc = (crc >> 8) ^ tab[(crc ^ d) & 0xff]
     return crc
 
+_crc64_tr = _crc32_tr = _crc16_tr   # native ints are python ints, so this works for all widths
+
 import crc
-crc.Implementation = 'native'
-crc._crc8_tr  = _crc8_tr
-crc._crc16_tr = _crc16_tr
-crc._crc32_tr = _crc16_tr
-crc._crc64_tr = _crc16_tr
\ No newline at end of file
+crc._register('native', globals())   # this becomes the default implementation
\ No newline at end of file
@@ -41,6 +41,16 @@ def _crc32_tr(crc: uint, data: ptr8, n: int, tab: ptr32) -> uint:
         i += 1
     return crc
 
+# the same, with the register kept in crc[0] (ptr32) between the calls, so nothing is allocated for the result
+@micropython.viper
+def _crc32_h(crc: ptr32, data: ptr8, n: int, tab: ptr32):
+    c: uint = uint(crc[0])
+    i: int  = 0
+    while i < n:
+        c = (c >> 8) ^ tab[(c & 0xff) ^ data[i]]
+        i += 1
+    crc[0] = c
+
 # --- arguments ---
 # .. lookup table address
 # .. n lenght of data
@@ -48,28 +58,615 @@ def _crc32_tr(crc: uint, data: ptr8, n: int, tab: ptr32) -> uint:
 # .. crc
 @micropython.viper
 def _crc64_h(crc: ptr32, data: ptr8, n: int, tab: ptr32):  # just a helper function
+    mask: uint = uint(0xffffffff)    # 32 bit words, also where the machine word is 64 bit
     crc0: uint = uint(crc[0])
     crc1: uint = uint(crc[1])
     i: uint  = 0
     while i < n:
         idx:uint = (crc0 & 0xff) ^ data[i]
-        crc0 = (crc1 << 24 | crc0 >> 8) ^ tab[2*idx]    # 64 bit pointer, low word
+        crc0 = ((crc1 << 24 | crc0 >> 8) & mask) ^ tab[2*idx]    # 64 bit pointer, low word
         crc1 = (crc1 >> 8) ^ tab[2*idx+1]               # 64 bit pointer, high word
         i += 1
     crc[0] = crc0
     crc[1] = crc1
 
-from array import array
-acrc = array('Q', (0,))
+from array import array     # each call passes the crc in an array of its own, so the wrappers are reentrant (threads)
 
 def _crc64_tr(crc, data, n, tab):
-    acrc[0] = crc
+    acrc = array('Q', (crc,))
     _crc64_h(acrc, data, n, tab)
     return acrc[0]
 
+# --- slicing-by-4 and slicing-by-8 versions ---
+#
+# --- arguments ---
+# .. lookup table address, 4 or 8 consecutive tables T0, T1, .. of 256 entries
+# .. n number of 4 or 8 byte blocks
+# .. data to be processed (only 8-bit address is used)
+# .. crc
+@micropython.viper
+def _crc8_ts4(crc: int, data: ptr8, n: int, tab: ptr8) -> int:
+    i: int  = 0
+    n <<= 2
+    while i < n:
+        crc = tab[768 + (crc ^ data[i])] ^ tab[512 + data[i+1]] ^ tab[256 + data[i+2]] ^ tab[data[i+3]]
+        i += 4
+    return crc
+
+@micropython.viper
+def _crc8_ts8(crc: int, data: ptr8, n: int, tab: ptr8) -> int:
+    i: int  = 0
+    n <<= 3
+    while i < n:
+        crc = (tab[1792 + (crc ^ data[i])] ^ tab[1536 + data[i+1]] ^ tab[1280 + data[i+2]] ^ tab[1024 + data[i+3]]
+               ^ tab[768 + data[i+4]] ^ tab[512 + data[i+5]] ^ tab[256 + data[i+6]] ^ tab[data[i+7]])
+        i += 8
+    return crc
+
+@micropython.viper
+def _crc16_ts4(crc: int, data: ptr8, n: int, tab: ptr16) -> int:
+    i: int  = 0
+    n <<= 2
+    while i < n:
+        crc = (tab[768 + ((crc ^ data[i]) & 0xff)] ^ tab[512 + ((crc >> 8) ^ data[i+1])]
+               ^ tab[256 + data[i+2]] ^ tab[data[i+3]])
+        i += 4
+    return crc
+
+@micropython.viper
+def _crc16_ts8(crc: int, data: ptr8, n: int, tab: ptr16) -> int:
+    i: int  = 0
+    n <<= 3
+    while i < n:
+        crc = (tab[1792 + ((crc ^ data[i]) & 0xff)] ^ tab[1536 + ((crc >> 8) ^ data[i+1])]
+               ^ tab[1280 + data[i+2]] ^ tab[1024 + data[i+3]]
+               ^ tab[768 + data[i+4]] ^ tab[512 + data[i+5]] ^ tab[256 + data[i+6]] ^ tab[data[i+7]])
+        i += 8
+    return crc
+
+@micropython.viper
+def _crc32_ts4(crc: uint, data: ptr8, n: int, tab: ptr32) -> uint:
+    i: int  = 0
+    n <<= 2
+    while i < n:
+        crc = (uint(tab[768 + ((crc ^ data[i]) & 0xff)]) ^ tab[512 + (((crc >> 8) ^ data[i+1]) & 0xff)]
+               ^ tab[256 + (((crc >> 16) ^ data[i+2]) & 0xff)] ^ tab[(crc >> 24) ^ data[i+3]])
+        i += 4
+    return crc
+
+@micropython.viper
+def _crc32_ts8(crc: uint, data: ptr8, n: int, tab: ptr32) -> uint:
+    i: int  = 0
+    n <<= 3
+    while i < n:
+        crc = (uint(tab[1792 + ((crc ^ data[i]) & 0xff)]) ^ tab[1536 + (((crc >> 8) ^ data[i+1]) & 0xff)]
+               ^ tab[1280 + (((crc >> 16) ^ data[i+2]) & 0xff)] ^ tab[1024 + ((crc >> 24) ^ data[i+3])]
+               ^ tab[768 + data[i+4]] ^ tab[512 + data[i+5]] ^ tab[256 + data[i+6]] ^ tab[data[i+7]])
+        i += 8
+    return crc
+
+# the same, with the register kept in crc[0] (ptr32)
+@micropython.viper
+def _crc32_hs4(crc: ptr32, data: ptr8, n: int, tab: ptr32):
+    c: uint = uint(crc[0])
+    i: int  = 0
+    n <<= 2
+    while i < n:
+        c = (uint(tab[768 + ((c ^ data[i]) & 0xff)]) ^ tab[512 + (((c >> 8) ^ data[i+1]) & 0xff)]
+             ^ tab[256 + (((c >> 16) ^ data[i+2]) & 0xff)] ^ tab[(c >> 24) ^ data[i+3]])
+        i += 4
+    crc[0] = c
+
+@micropython.viper
+def _crc32_hs8(crc: ptr32, data: ptr8, n: int, tab: ptr32):
+    c: uint = uint(crc[0])
+    i: int  = 0
+    n <<= 3
+    while i < n:
+        c = (uint(tab[1792 + ((c ^ data[i]) & 0xff)]) ^ tab[1536 + (((c >> 8) ^ data[i+1]) & 0xff)]
+             ^ tab[1280 + (((c >> 16) ^ data[i+2]) & 0xff)] ^ tab[1024 + ((c >> 24) ^ data[i+3])]
+             ^ tab[768 + data[i+4]] ^ tab[512 + data[i+5]] ^ tab[256 + data[i+6]] ^ tab[data[i+7]])
+        i += 8
+    crc[0] = c
+
+# --- arguments ---
+# .. lookup table address, entries are 64 bit, so each index is doubled for ptr32
+# .. n number of 4 or 8 byte blocks
+# .. data to be processed (only 8-bit address is used)
+# .. crc (ptr64)
+@micropython.viper
+def _crc64_hs4(crc: ptr32, data: ptr8, n: int, tab: ptr32):  # just a helper function
+    crc0: uint = uint(crc[0])
+    crc1: uint = uint(crc[1])
+    i: int  = 0
+    n <<= 2
+    while i < n:
+        i0: uint = 2 * (768 + ((crc0 ^ data[i]) & 0xff))
+        i1: uint = 2 * (512 + (((crc0 >> 8) ^ data[i+1]) & 0xff))
+        i2: uint = 2 * (256 + (((crc0 >> 16) ^ data[i+2]) & 0xff))
+        i3: uint = 2 * ((crc0 >> 24) ^ data[i+3])
+        crc0 = crc1 ^ tab[i0] ^ tab[i1] ^ tab[i2] ^ tab[i3]                 # crc >> 32, low words
+        crc1 = uint(tab[i0+1]) ^ tab[i1+1] ^ tab[i2+1] ^ tab[i3+1]          # high words
+        i += 4
+    crc[0] = crc0
+    crc[1] = crc1
+
+@micropython.viper
+def _crc64_hs8(crc: ptr32, data: ptr8, n: int, tab: ptr32):  # just a helper function
+    crc0: uint = uint(crc[0])
+    crc1: uint = uint(crc[1])
+    i: int  = 0
+    n <<= 3
+    while i < n:
+        i0: uint = 2 * (1792 + ((crc0 ^ data[i]) & 0xff))
+        i1: uint = 2 * (1536 + (((crc0 >> 8) ^ data[i+1]) & 0xff))
+        i2: uint = 2 * (1280 + (((crc0 >> 16) ^ data[i+2]) & 0xff))
+        i3: uint = 2 * (1024 + ((crc0 >> 24) ^ data[i+3]))
+        i4: uint = 2 * (768 + ((crc1 ^ data[i+4]) & 0xff))
+        i5: uint = 2 * (512 + (((crc1 >> 8) ^ data[i+5]) & 0xff))
+        i6: uint = 2 * (256 + (((crc1 >> 16) ^ data[i+6]) & 0xff))
+        i7: uint = 2 * ((crc1 >> 24) ^ data[i+7])
+        crc0 = uint(tab[i0]) ^ tab[i1] ^ tab[i2] ^ tab[i3] ^ tab[i4] ^ tab[i5] ^ tab[i6] ^ tab[i7]
+        crc1 = uint(tab[i0+1]) ^ tab[i1+1] ^ tab[i2+1] ^ tab[i3+1] ^ tab[i4+1] ^ tab[i5+1] ^ tab[i6+1] ^ tab[i7+1]
+        i += 8
+    crc[0] = crc0
+    crc[1] = crc1
+
+def _crc64_ts4(crc, data, n, tab):
+    acrc = array('Q', (crc,))
+    _crc64_hs4(acrc, data, n, tab)
+    return acrc[0]
+
+def _crc64_ts8(crc, data, n, tab):
+    acrc = array('Q', (crc,))
+    _crc64_hs8(acrc, data, n, tab)
+    return acrc[0]
+
+# --- low memory versions: nibble table (16 entries) and bitwise (polynomial in tab[0]) ---
+#
+# The reflected versions (nr, br) shift right, the others (nl, bl) shift left with the register left
+# aligned in the 32 bit word (widths up to 32) or in the two words of the 64 bit crc.
+#
+# --- arguments ---
+# .. lookup table address (nibble table or polynomial)
+# .. n lenght of data
+# .. data to be processed (only 8-bit address is used)
+# .. crc
+@micropython.viper
+def _crc32_nr(crc: uint, data: ptr8, n: int, tab: ptr32) -> uint:
+    i: int  = 0
+    while i < n:
+        crc ^= data[i]
+        crc = (crc >> 4) ^ tab[crc & 0xf]
+        crc = (crc >> 4) ^ tab[crc & 0xf]
+        i += 1
+    return crc
+
+@micropython.viper
+def _crc32_nl(crc: uint, data: ptr8, n: int, tab: ptr32) -> uint:
+    mask: uint = uint(0xffffffff)    # 32 bit words, also where the machine word is 64 bit
+    i: int  = 0
+    while i < n:
+        crc ^= uint(data[i]) << 24
+        crc = ((crc << 4) & mask) ^ tab[crc >> 28]
+        crc = ((crc << 4) & mask) ^ tab[crc >> 28]
+        i += 1
+    return crc
+
+@micropython.viper
+def _crc32_br(crc: uint, data: ptr8, n: int, tab: ptr32) -> uint:
+    poly: uint = uint(tab[0])
+    i: int  = 0
+    while i < n:
+        crc ^= data[i]
+        j: int = 0
+        while j < 8:
+            if crc & 1:
+                crc = (crc >> 1) ^ poly
+            else:
+                crc >>= 1
+            j += 1
+        i += 1
+    return crc
+
+@micropython.viper
+def _crc32_bl(crc: uint, data: ptr8, n: int, tab: ptr32) -> uint:
+    mask: uint = uint(0xffffffff)    # 32 bit words, also where the machine word is 64 bit
+    poly: uint = uint(tab[0])
+    i: int  = 0
+    while i < n:
+        crc ^= uint(data[i]) << 24
+        j: int = 0
+        while j < 8:
+            if crc >> 31:
+                crc = ((crc << 1) & mask) ^ poly
+            else:
+                crc = (crc << 1) & mask
+            j += 1
+        i += 1
+    return crc
+
+# --- arguments ---
+# .. lookup table address, entries are 64 bit, so each index is doubled for ptr32
+# .. n lenght of data
+# .. data to be processed (only 8-bit address is used)
+# .. crc (ptr64)
+@micropython.viper
+def _crc64_nrh(crc: ptr32, data: ptr8, n: int, tab: ptr32):  # just a helper function
+    mask: uint = uint(0xffffffff)    # 32 bit words, also where the machine word is 64 bit
+    crc0: uint = uint(crc[0])
+    crc1: uint = uint(crc[1])
+    i: int  = 0
+    while i < n:
+        crc0 ^= data[i]
+        idx: uint = 2 * (crc0 & 0xf)
+        crc0 = ((crc1 << 28 | crc0 >> 4) & mask) ^ tab[idx]
+        crc1 = (crc1 >> 4) ^ tab[idx+1]
+        idx = 2 * (crc0 & 0xf)
+        crc0 = ((crc1 << 28 | crc0 >> 4) & mask) ^ tab[idx]
+        crc1 = (crc1 >> 4) ^ tab[idx+1]
+        i += 1
+    crc[0] = crc0
+    crc[1] = crc1
+
+@micropython.viper
+def _crc64_nlh(crc: ptr32, data: ptr8, n: int, tab: ptr32):  # just a helper function
+    mask: uint = uint(0xffffffff)    # 32 bit words, also where the machine word is 64 bit
+    crc0: uint = uint(crc[0])
+    crc1: uint = uint(crc[1])
+    i: int  = 0
+    while i < n:
+        crc1 ^= uint(data[i]) << 24
+        idx: uint = 2 * (crc1 >> 28)
+        crc1 = ((crc1 << 4 | crc0 >> 28) & mask) ^ tab[idx+1]
+        crc0 = ((crc0 << 4) & mask) ^ tab[idx]
+        idx = 2 * (crc1 >> 28)
+        crc1 = ((crc1 << 4 | crc0 >> 28) & mask) ^ tab[idx+1]
+        crc0 = ((crc0 << 4) & mask) ^ tab[idx]
+        i += 1
+    crc[0] = crc0
+    crc[1] = crc1
+
+@micropython.viper
+def _crc64_brh(crc: ptr32, data: ptr8, n: int, tab: ptr32):  # just a helper function
+    mask: uint = uint(0xffffffff)    # 32 bit words, also where the machine word is 64 bit
+    crc0: uint = uint(crc[0])
+    crc1: uint = uint(crc[1])
+    poly0: uint = uint(tab[0])
+    poly1: uint = uint(tab[1])
+    i: int  = 0
+    while i < n:
+        crc0 ^= data[i]
+        j: int = 0
+        while j < 8:
+            if crc0 & 1:
+                crc0 = ((crc1 << 31 | crc0 >> 1) & mask) ^ poly0
+                crc1 = (crc1 >> 1) ^ poly1
+            else:
+                crc0 = (crc1 << 31 | crc0 >> 1) & mask
+                crc1 >>= 1
+            j += 1
+        i += 1
+    crc[0] = crc0
+    crc[1] = crc1
+
+@micropython.viper
+def _crc64_blh(crc: ptr32, data: ptr8, n: int, tab: ptr32):  # just a helper function
+    mask: uint = uint(0xffffffff)    # 32 bit words, also where the machine word is 64 bit
+    crc0: uint = uint(crc[0])
+    crc1: uint = uint(crc[1])
+    poly0: uint = uint(tab[0])
+    poly1: uint = uint(tab[1])
+    i: int  = 0
+    while i < n:
+        crc1 ^= uint(data[i]) << 24
+        j: int = 0
+        while j < 8:
+            if crc1 >> 31:
+                crc1 = ((crc1 << 1 | crc0 >> 31) & mask) ^ poly1
+                crc0 = ((crc0 << 1) & mask) ^ poly0
+            else:
+                crc1 = (crc1 << 1 | crc0 >> 31) & mask
+                crc0 = (crc0 << 1) & mask
+            j += 1
+        i += 1
+    crc[0] = crc0
+    crc[1] = crc1
+
+def _crc64_nr(crc, data, n, tab):
+    acrc = array('Q', (crc,))
+    _crc64_nrh(acrc, data, n, tab)
+    return acrc[0]
+
+def _crc64_nl(crc, data, n, tab):
+    acrc = array('Q', (crc,))
+    _crc64_nlh(acrc, data, n, tab)
+    return acrc[0]
+
+def _crc64_br(crc, data, n, tab):
+    acrc = array('Q', (crc,))
+    _crc64_brh(acrc, data, n, tab)
+    return acrc[0]
+
+def _crc64_bl(crc, data, n, tab):
+    acrc = array('Q', (crc,))
+    _crc64_blh(acrc, data, n, tab)
+    return acrc[0]
+
+# --- batch versions: crcs of many frames in one buffer ---
+#
+# --- arguments ---
+# .. lookup table address
+# .. n number of frames
+# .. data buffer holding the frames (only 8-bit address is used)
+# .. ctl (ptr32): initial register, xorout (register form), byte swap flag, shift,
+#    address of offsets (ptr32), address of lengths (ptr32), address of out (crc storage size)
+@micropython.viper
+def _crc8_tp(ctl: ptr32, data: ptr8, n: int, tab: ptr8):
+    offs = ptr32(ctl[4])
+    lens = ptr32(ctl[5])
+    out = ptr8(ctl[6])
+    j: int = 0
+    while j < n:
+        crc: int = ctl[0]
+        i: int = offs[j]
+        e: int = i + lens[j]
+        while i < e:
+            crc = tab[crc ^ data[i]]
+            i += 1
+        out[j] = (crc ^ ctl[1]) >> ctl[3]
+        j += 1
+
+@micropython.viper
+def _crc16_tp(ctl: ptr32, data: ptr8, n: int, tab: ptr16):
+    offs = ptr32(ctl[4])
+    lens = ptr32(ctl[5])
+    out = ptr16(ctl[6])
+    j: int = 0
+    while j < n:
+        crc: int = ctl[0]
+        i: int = offs[j]
+        e: int = i + lens[j]
+        while i < e:
+            crc = (crc >> 8) ^ tab[(crc & 0xff) ^ data[i]]
+            i += 1
+        crc ^= ctl[1]
+        if ctl[2]:
+            crc = (crc & 0xff) << 8 | crc >> 8
+        out[j] = crc >> ctl[3]
+        j += 1
+
+@micropython.viper
+def _crc32_tp(ctl: ptr32, data: ptr8, n: int, tab: ptr32):
+    offs = ptr32(ctl[4])
+    lens = ptr32(ctl[5])
+    out = ptr32(ctl[6])
+    j: int = 0
+    while j < n:
+        crc: uint = uint(ctl[0])
+        i: int = offs[j]
+        e: int = i + lens[j]
+        while i < e:
+            crc = (crc >> 8) ^ tab[(crc & 0xff) ^ data[i]]
+            i += 1
+        crc ^= uint(ctl[1])
+        if ctl[2]:
+            crc = (crc & 0xff) << 24 | (crc & 0xff00) << 8 | (crc >> 8) & 0xff00 | crc >> 24
+        out[j] = crc >> uint(ctl[3])
+        j += 1
+
+# --- digest of several buffers, one after the other, see Calculator.digest_iov() ---
+#
+# --- arguments ---
+# .. lookup table address
+# .. m number of buffers
+# .. iov (ptr32): address and length of each buffer
+# .. crc
+@micropython.viper
+def _crc8_ti(crc: int, iov: ptr32, m: int, tab: ptr8) -> int:
+    j: int = 0
+    while j < m:
+        data = ptr8(iov[2*j])
+        n: int = iov[2*j+1]
+        i: int = 0
+        while i < n:
+            crc = tab[crc ^ data[i]]
+            i += 1
+        j += 1
+    return crc
+
+@micropython.viper
+def _crc16_ti(crc: int, iov: ptr32, m: int, tab: ptr16) -> int:
+    j: int = 0
+    while j < m:
+        data = ptr8(iov[2*j])
+        n: int = iov[2*j+1]
+        i: int = 0
+        while i < n:
+            crc = (crc >> 8) ^ tab[(crc & 0xff) ^ data[i]]
+            i += 1
+        j += 1
+    return crc
+
+@micropython.viper
+def _crc32_ti(crc: uint, iov: ptr32, m: int, tab: ptr32) -> uint:
+    j: int = 0
+    while j < m:
+        data = ptr8(iov[2*j])
+        n: int = iov[2*j+1]
+        i: int = 0
+        while i < n:
+            crc = (crc >> 8) ^ tab[(crc & 0xff) ^ data[i]]
+            i += 1
+        j += 1
+    return crc
+
+@micropython.viper
+def _crc64_hi(crc: ptr32, iov: ptr32, m: int, tab: ptr32):  # just a helper function
+    mask: uint = uint(0xffffffff)    # 32 bit words, also where the machine word is 64 bit
+    crc0: uint = uint(crc[0])
+    crc1: uint = uint(crc[1])
+    j: int = 0
+    while j < m:
+        data = ptr8(iov[2*j])
+        n: int = iov[2*j+1]
+        i: int = 0
+        while i < n:
+            idx:uint = (crc0 & 0xff) ^ data[i]
+            crc0 = ((crc1 << 24 | crc0 >> 8) & mask) ^ tab[2*idx]    # 64 bit pointer, low word
+            crc1 = (crc1 >> 8) ^ tab[2*idx+1]               # 64 bit pointer, high word
+            i += 1
+        j += 1
+    crc[0] = crc0
+    crc[1] = crc1
+
+def _crc64_ti(crc, iov, m, tab):
+    acrc = array('Q', (crc,))
+    _crc64_hi(acrc, iov, m, tab)
+    return acrc[0]
+
+# --- copy and digest in one loop, see Calculator.digest_into() ---
+#
+# --- arguments ---
+# .. ctl (ptr32): lookup table address, destination address
+# .. n lenght of data
+# .. data to be processed and copied (only 8-bit address is used)
+# .. crc
+@micropython.viper
+def _crc8_tc(crc: int, data: ptr8, n: int, ctl: ptr32) -> int:
+    tab = ptr8(ctl[0])
+    dst = ptr8(ctl[1])
+    i: int  = 0
+    while i < n:
+        b: int = data[i]
+        dst[i] = b
+        crc = tab[crc ^ b]
+        i += 1
+    return crc
+
+@micropython.viper
+def _crc16_tc(crc: int, data: ptr8, n: int, ctl: ptr32) -> int:
+    tab = ptr16(ctl[0])
+    dst = ptr8(ctl[1])
+    i: int  = 0
+    while i < n:
+        b: int = data[i]
+        dst[i] = b
+        crc = (crc >> 8) ^ tab[(crc & 0xff) ^ b]
+        i += 1
+    return crc
+
+@micropython.viper
+def _crc32_tc(crc: uint, data: ptr8, n: int, ctl: ptr32) -> uint:
+    tab = ptr32(ctl[0])
+    dst = ptr8(ctl[1])
+    i: int  = 0
+    while i < n:
+        b: uint = uint(data[i])
+        dst[i] = b
+        crc = (crc >> 8) ^ tab[(crc & 0xff) ^ b]
+        i += 1
+    return crc
+
+# --- rolling crc scan: crcs of all windows of a buffer, compared with a set of targets ---
+#
+# --- arguments ---
+# .. lookup table address
+# .. n length of data
+# .. data to be scanned (only 8-bit address is used)
+# .. ctl (ptr32): register, window, position of the next incoming byte, address of the outgoing byte table
+#    (crc storage size), address of the sorted target registers (ptr32), number of targets,
+#    address of the results (ptr32), their number
+# returns the number of window offsets stored in the results, it stops when they are full
+@micropython.viper
+def _crc8_rs(ctl: ptr32, data: ptr8, n: int, tab: ptr8) -> int:
+    out = ptr8(ctl[3])
+    tg = ptr32(ctl[4])
+    nt: int = ctl[5]
+    res = ptr32(ctl[6])
+    w: int = ctl[1]
+    i: int = ctl[2]
+    crc: int = ctl[0]
+    k: int = 0
+    while i < n:
+        crc = tab[crc ^ data[i]] ^ out[data[i - w]]
+        i += 1
+        lo: int = 0                                     # binary search of the targets
+        hi: int = nt
+        while lo < hi:
+            mid: int = (lo + hi) >> 1
+            if tg[mid] < crc:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < nt and tg[lo] == crc:
+            res[k] = i - w
+            k += 1
+            if k == ctl[7]:
+                break
+    ctl[0] = crc
+    ctl[2] = i
+    return k
+
+@micropython.viper
+def _crc16_rs(ctl: ptr32, data: ptr8, n: int, tab: ptr16) -> int:
+    out = ptr16(ctl[3])
+    tg = ptr32(ctl[4])
+    nt: int = ctl[5]
+    res = ptr32(ctl[6])
+    w: int = ctl[1]
+    i: int = ctl[2]
+    crc: int = ctl[0]
+    k: int = 0
+    while i < n:
+        crc = (crc >> 8) ^ tab[(crc & 0xff) ^ data[i]] ^ out[data[i - w]]
+        i += 1
+        lo: int = 0
+        hi: int = nt
+        while lo < hi:
+            mid: int = (lo + hi) >> 1
+            if tg[mid] < crc:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < nt and tg[lo] == crc:
+            res[k] = i - w
+            k += 1
+            if k == ctl[7]:
+                break
+    ctl[0] = crc
+    ctl[2] = i
+    return k
+
+@micropython.viper
+def _crc32_rs(ctl: ptr32, data: ptr8, n: int, tab: ptr32) -> int:
+    out = ptr32(ctl[3])
+    tg = ptr32(ctl[4])
+    nt: int = ctl[5]
+    res = ptr32(ctl[6])
+    w: int = ctl[1]
+    i: int = ctl[2]
+    crc: uint = uint(ctl[0])
+    k: int = 0
+    while i < n:
+        crc = (crc >> 8) ^ tab[(crc & 0xff) ^ data[i]] ^ out[data[i - w]]
+        i += 1
+        lo: int = 0
+        hi: int = nt
+        while lo < hi:
+            mid: int = (lo + hi) >> 1
+            if uint(tg[mid]) < crc:                     # unsigned compare
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < nt and uint(tg[lo]) == crc:
+            res[k] = i - w
+            k += 1
+            if k == ctl[7]:
+                break
+    ctl[0] = crc
+    ctl[2] = i
+    return k
+
 import crc
-crc.Implementation = 'viper'
-crc._crc8_tr  = _crc8_tr
-crc._crc16_tr = _crc16_tr
-crc._crc32_tr = _crc32_tr
-crc._crc64_tr = _crc64_tr
\ No newline at end of file
+crc._register('viper', globals(), True)   # this becomes the default implementation
\ No newline at end of file
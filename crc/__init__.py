@@ -1,6 +1,10 @@
 # Micropython class to compute a CRC (16 or 32 bit) with different algorithms and implementations
 
 from array import array
+try:
+    from uctypes import addressof, bytearray_at
+except ImportError:                 # CPython: only the bytecode implementations, they get the data as buffer
+    addressof = bytearray_at = None
 
 # bit reverse of all bits in a byte
 def rbit8(v):
@@ -71,74 +75,187 @@ def _tinit_r(crc, poly):
             crc = crc >> 1
     return crc
 
-class Crc8:
-    # Name      (Width, Poly, Init, RefIn, RefOut, Xorout, Check)
-    crc7ls    = (8,     0x12, 0x00, False, False,  0x00,   0xea)
-    crc8      = (8,     0x07, 0x00, False, False,  0x00,   0xf4)
-    ccitt     = crc8
-    saej1850  = (8,     0x1d, 0x00, False, False,  0x00,   0x37)
-    autosar   = (8,     0x2f, 0xff, False, False,  0xff,   0xdf)
-    bluetooth = (8,     0xa7, 0x00, True,  True,   0x00,   0x26)
-    maxim_dow = (8,     0x31, 0x00, True,  True,   0x00,   0xa1)
-#     cdma2000  = (8,     0x9b, 0xff, False, False,  0x00,   0xda)
-#     darc      = (8,     0x39, 0x00, True,  True,   0x00,   0x15)
-#     dvb_s2    = (8,     0xd5, 0x00, False, False,  0x00,   0xbc)
-#     ebu       = (8,     0x1d, 0xff, True,  True,   0x00,   0x97)
-#     i_code    = (8,     0x1d, 0xfd, False, False,  0x00,   0x7e)
-#     itu       = (8,     0x07, 0x00, False, False,  0x55,   0xa1)
-#     rohc      = (8,     0x07, 0xff, True,  True,   0x00,   0xd0)
-#     wcdma     = (8,     0x9b, 0x00, True,  True,   0x00,   0x25)
-
-class Crc16:
-    # Name      (Width,  Poly,   Init,   RefIn, RefOut, Xorout, Check)
-    xmodem    = (16,    0x1021, 0x0000, False, False,  0x0000, 0x31c3)
-    usb       = (16,    0x8005, 0xffff, True,  True,   0xffff, 0xb4c8)
-    ccitt     = xmodem
-    gsm       = (16,    0x1021, 0x0000, False, False,  0xffff, 0xce3c)
-    profibus  = (16,    0x1dcf, 0xffff, False, False,  0xffff, 0xa819)
-    modbus    = (16,    0x8005, 0xffff, True,  True,   0x0000, 0x4b37)
-#     arc       = (16,    0x8005, 0x0000, True,  True,   0x0000, 0xbb3d),
-#     buypass   = (16,    0x8005, 0x0000, False, False,  0x0000, 0xfee8),
-#     dds_110   = (16,    0x8005, 0x800d, False, False,  0x0000, 0x9ecf),
-#     maxim     = (16,    0x8005, 0x0000, True,  True,   0xffff, 0x44c2),
-#     aug_ccitt = (16,    0x1021, 0x1d0f, False, False,  0x0000, 0xe5cc),
-#     ccitt_false=(16,    0x1021, 0xffff, False, False,  0x0000, 0x29b1),
-#     genibus   = (16,    0x1021, 0xffff, False, False,  0xffff, 0xd64e),
-#     kermit    = (16,    0x1021, 0x0000, True,  True,   0x0000, 0x2189),
-#     mcrf4xx   = (16,    0x1021, 0xffff, True,  True,   0x0000, 0x6f91),
-#     riello    = (16,    0x1021, 0xb2aa, True,  True,   0x0000, 0x63d0),
-#     tms37157  = (16,    0x1021, 0x89ec, True,  True,   0x0000, 0x26b1),
-#     x_25        (16,    0x1021, 0xffff, True,  True,   0xffff, 0x906e),
-#     a           (16,    0x1021, 0xc6c6, True,  True,   0x0000, 0xbf05)
-#     cdma2000  = (16,    0xc867, 0xffff, False, False,  0x0000, 0x4c06),
-#     dect_r    = (16,    0x0589, 0x0000, False, False,  0x0001, 0x007e),
-#     dect_x    = (16,    0x0589, 0x0000, False, False,  0x0000, 0x007f),
-#     dnp       = (16,    0x3d65, 0x0000, True,  True,   0xffff, 0xea82),
-#     en_13757  = (16,    0x3d65, 0x0000, False, False,  0xffff, 0xc2b7),
-#     t10-dif   = (16,    0x8bb7, 0x0000, False, False,  0x0000, 0xd0db),
-#     teledisk  = (16,    0xa097, 0x0000, False, False,  0x0000, 0x0fb3),
-
-class Crc32:
-    # Name     (Width,  Poly,       Init,       RefIn, RefOut, Xorout,     Check)
-    crc32      = (32,    0x04c11db7, 0xffffffff, True,  True,   0xffffffff, 0xcbf43926)
-    autosar    = (32,    0xf4acfb13, 0xffffffff, True,  True,   0xffffffff, 0x1697d06a)
-    bzip2      = (32,    0x04c11db7, 0xffffffff, False, False,  0xffffffff, 0xfc891918)
-    posix      = (32,    0x04c11db7, 0x00000000, False, False,  0xffffffff, 0x765e7680)
-    sata       = (32,    0x04c11db7, 0x52325032, False, False,  0x00000000, 0xcf72afe8)
-#     jamcrc     = (32,    0x04c11db7, 0xffffffff, True,  True,   0x00000000, 0x340bc6d9)
-#     mpeg-2     = (32,    0x04c11db7, 0xffffffff, False, False,  0x00000000, 0x0376e6e7)
-#     xfer       = (32,    0x000000af, 0x00000000, False, False,  0x00000000, 0xbd0be338)
-#     c          = (32,    0x1edc6f41, 0xffffffff, True,  True,   0xffffffff, 0xe3069283)
-#     d          = (32,    0xa833982b, 0xffffffff, True,  True,   0xffffffff, 0x87315576)
-#     q          = (32,    0x814141ab, 0x00000000, False, False,  0x00000000, 0x3010bf7f)
-    
-class Crc64:
-    # Name   (Width,  Poly,           Init,                RefIn, RefOut, Xorout,             Check)
-    crc64   = (64, 0x42f0e1eba9ea3693, 0x0000000000000000, False, False,  0x0000000000000000, 0x6c40df5f0b497347)
-    ecma_182 = crc64
-    go_iso  = (64, 0x000000000000001b, 0xffffffffffffffff, True,  True,   0xffffffffffffffff, 0xb90956c775a41001)
-#     we      = (64, 0x42f0e1eba9ea3693, 0xffffffffffffffff, False, False,  0xffffffffffffffff, 0x62ec59e3f1a4f00a)
-#     xz      = (64, 0x42f0e1eba9ea3693, 0xffffffffffffffff, True,  True,   0xffffffffffffffff, 0x995dc9bbdf1939fa)
+# ----- Catalog of crc definitions -----
+#
+# The crcs of the RevEng catalogue (https://reveng.sourceforge.io/crc-catalogue/all.htm) and a few more,
+# one line each: width, poly, init, refin and refout (r: reflected, n: not), xorout, check (hex but width), names.
+# They are decoded only when accessed, e.g. Crc16.modbus, as a tuple (width, poly, init, refin, refout, xorout, check).
+# As one bytes object the catalog takes about 4.5 kB (in flash, if frozen), and no RAM for the unused crcs.
+#
+# The names are the lower case RevEng names and aliases, '-' and '/' replaced by '_'. The crcs are grouped by
+# storage width into Crc8, Crc16, Crc32 and Crc64, and the prefix of the group is dropped:
+# CRC-16/MODBUS is Crc16.modbus, CRC-5/USB is Crc8.crc5_usb, CRC-32 is Crc32.crc32.
+# Names of former versions are kept (e.g. Crc16.ccitt is xmodem, Crc8.saej1850 is gsm_a).
+_catalog = (
+    b'3 3 0 nn 7 4 |crc3_gsm|\n'
+    b'3 3 7 rr 0 6 |crc3_rohc|\n'
+    b'4 3 0 rr 0 7 |crc4_g_704|crc4_itu|\n'
+    b'4 3 f nn f b |crc4_interlaken|\n'
+    b'5 9 9 nn 0 0 |crc5_epc_c1g2|crc5_epc|\n'
+    b'5 15 0 rr 0 7 |crc5_g_704|crc5_itu|\n'
+    b'5 5 1f rr 1f 19 |crc5_usb|\n'
+    b'6 27 3f nn 0 d |crc6_cdma2000_a|\n'
+    b'6 7 3f nn 0 3b |crc6_cdma2000_b|\n'
+    b'6 19 0 rr 0 26 |crc6_darc|\n'
+    b'6 3 0 rr 0 6 |crc6_g_704|crc6_itu|\n'
+    b'6 2f 0 nn 3f 13 |crc6_gsm|\n'
+    b'7 9 0 nn 0 75 |crc7_mmc|crc7|\n'
+    b'7 4f 7f rr 0 53 |crc7_rohc|\n'
+    b'7 45 0 nn 0 61 |crc7_umts|\n'
+    b'8 2f ff nn ff df |autosar|\n'
+    b'8 a7 0 rr 0 26 |bluetooth|\n'
+    b'8 9b ff nn 0 da |cdma2000|\n'
+    b'8 39 0 rr 0 15 |darc|\n'
+    b'8 d5 0 nn 0 bc |dvb_s2|\n'
+    b'8 1d 0 nn 0 37 |gsm_a|saej1850|\n'
+    b'8 49 0 nn ff 94 |gsm_b|\n'
+    b'8 1d ff nn 0 b4 |hitag|\n'
+    b'8 7 0 nn 55 a1 |i_432_1|itu|\n'
+    b'8 1d fd nn 0 7e |i_code|\n'
+    b'8 9b 0 nn 0 ea |lte|\n'
+    b'8 31 0 rr 0 a1 |maxim_dow|maxim|dow_crc|\n'
+    b'8 1d c7 nn 0 99 |mifare_mad|\n'
+    b'8 31 ff nn 0 f7 |nrsc_5|\n'
+    b'8 2f 0 nn 0 3e |opensafety|\n'
+    b'8 7 ff rr 0 d0 |rohc|\n'
+    b'8 1d ff nn ff 4b |sae_j1850|\n'
+    b'8 7 0 nn 0 f4 |smbus|crc8|ccitt|\n'
+    b'8 1d ff rr 0 97 |tech_3250|aes|ebu|\n'
+    b'8 9b 0 rr 0 25 |wcdma|\n'
+    b'8 12 0 nn 0 ea |crc7ls|\n'
+    b'10 233 0 nn 0 199 |crc10_atm|crc10|crc10_i_610|\n'
+    b'10 3d9 3ff nn 0 233 |crc10_cdma2000|\n'
+    b'10 175 0 nn 3ff 12a |crc10_gsm|\n'
+    b'11 385 1a nn 0 5a3 |crc11_flexray|crc11|\n'
+    b'11 307 0 nn 0 61 |crc11_umts|\n'
+    b'12 f13 fff nn 0 d4d |crc12_cdma2000|\n'
+    b'12 80f 0 nn 0 f5b |crc12_dect|x_crc_12|\n'
+    b'12 d31 0 nn fff b34 |crc12_gsm|\n'
+    b'12 80f 0 nr 0 daf |crc12_umts|crc12_3gpp|\n'
+    b'13 1cf5 0 nn 0 4fa |crc13_bbc|\n'
+    b'14 805 0 rr 0 82d |crc14_darc|\n'
+    b'14 202d 0 nn 3fff 30ae |crc14_gsm|\n'
+    b'15 4599 0 nn 0 59e |crc15_can|crc15|\n'
+    b'15 6815 0 nn 1 2566 |crc15_mpt1327|\n'
+    b'16 8005 0 rr 0 bb3d |arc|crc16|lha|crc_ibm|\n'
+    b'16 c867 ffff nn 0 4c06 |cdma2000|\n'
+    b'16 8005 ffff nn 0 aee7 |cms|\n'
+    b'16 8005 800d nn 0 9ecf |dds_110|\n'
+    b'16 589 0 nn 1 7e |dect_r|r_crc_16|\n'
+    b'16 589 0 nn 0 7f |dect_x|x_crc_16|\n'
+    b'16 3d65 0 rr ffff ea82 |dnp|\n'
+    b'16 3d65 0 nn ffff c2b7 |en_13757|\n'
+    b'16 1021 ffff nn ffff d64e |genibus|darc|epc|epc_c1g2|i_code|\n'
+    b'16 1021 0 nn ffff ce3c |gsm|\n'
+    b'16 1021 ffff nn 0 29b1 |ibm_3740|autosar|ccitt_false|\n'
+    b'16 1021 ffff rr ffff 906e |ibm_sdlc|iso_hdlc|iso_iec_14443_3_b|x_25|crc_b|\n'
+    b'16 1021 c6c6 rr 0 bf05 |iso_iec_14443_3_a|crc_a|a|\n'
+    b'16 1021 0 rr 0 2189 |kermit|bluetooth|ccitt_true|v_41_lsb|crc_ccitt|\n'
+    b'16 6f63 0 nn 0 bdf4 |lj1200|\n'
+    b'16 5935 ffff nn 0 772b |m17|\n'
+    b'16 8005 0 rr ffff 44c2 |maxim_dow|maxim|\n'
+    b'16 1021 ffff rr 0 6f91 |mcrf4xx|\n'
+    b'16 8005 ffff rr 0 4b37 |modbus|\n'
+    b'16 80b ffff rr 0 a066 |nrsc_5|\n'
+    b'16 5935 0 nn 0 5d38 |opensafety_a|\n'
+    b'16 755b 0 nn 0 20fe |opensafety_b|\n'
+    b'16 1dcf ffff nn ffff a819 |profibus|iec_61158_2|\n'
+    b'16 1021 b2aa rr 0 63d0 |riello|\n'
+    b'16 1021 1d0f nn 0 e5cc |spi_fujitsu|aug_ccitt|\n'
+    b'16 8bb7 0 nn 0 d0db |t10_dif|\n'
+    b'16 a097 0 nn 0 fb3 |teledisk|\n'
+    b'16 1021 89ec rr 0 26b1 |tms37157|\n'
+    b'16 8005 0 nn 0 fee8 |umts|buypass|verifone|\n'
+    b'16 8005 ffff rr ffff b4c8 |usb|\n'
+    b'16 1021 0 nn 0 31c3 |xmodem|acorn|lte|v_41_msb|zmodem|ccitt|\n'
+    b'17 1685b 0 nn 0 4f03 |crc17_can_fd|\n'
+    b'21 102899 0 nn 0 ed841 |crc21_can_fd|\n'
+    b'24 65b 555555 rr 0 c25a56 |crc24_ble|\n'
+    b'24 5d6dcb fedcba nn 0 7979bd |crc24_flexray_a|\n'
+    b'24 5d6dcb abcdef nn 0 1f23b8 |crc24_flexray_b|\n'
+    b'24 328b63 ffffff nn ffffff b4f3e6 |crc24_interlaken|\n'
+    b'24 864cfb 0 nn 0 cde703 |crc24_lte_a|\n'
+    b'24 800063 0 nn 0 23ef52 |crc24_lte_b|\n'
+    b'24 864cfb b704ce nn 0 21cf02 |crc24_openpgp|crc24|\n'
+    b'24 800063 ffffff nn ffffff 200fa5 |crc24_os_9|\n'
+    b'30 2030b9c7 3fffffff nn 3fffffff 4c34abf |crc30_cdma|\n'
+    b'31 4c11db7 7fffffff nn 7fffffff ce9e46c |crc31_philips|\n'
+    b'32 814141ab 0 nn 0 3010bf7f |aixm|crc32q|q|\n'
+    b'32 f4acfb13 ffffffff rr ffffffff 1697d06a |autosar|\n'
+    b'32 a833982b ffffffff rr ffffffff 87315576 |base91_d|crc32d|d|\n'
+    b'32 4c11db7 ffffffff nn ffffffff fc891918 |bzip2|aal5|dect_b|b_crc_32|\n'
+    b'32 8001801b 0 rr 0 6ec2edc4 |cd_rom_edc|\n'
+    b'32 4c11db7 0 nn ffffffff 765e7680 |cksum|posix|\n'
+    b'32 1edc6f41 ffffffff rr ffffffff e3069283 |iscsi|base91_c|castagnoli|interlaken|crc32c|nvme|c|\n'
+    b'32 4c11db7 ffffffff rr ffffffff cbf43926 |iso_hdlc|crc32|adccp|v_42|xz|pkzip|\n'
+    b'32 4c11db7 ffffffff rr 0 340bc6d9 |jamcrc|\n'
+    b'32 741b8cd7 ffffffff rr 0 d2c22f51 |mef|\n'
+    b'32 4c11db7 ffffffff nn 0 376e6e7 |mpeg_2|\n'
+    b'32 af 0 nn 0 bd0be338 |xfer|\n'
+    b'32 4c11db7 52325032 nn 0 cf72afe8 |sata|\n'
+    b'40 4820009 0 nn ffffffffff d4164fc646 |crc40_gsm|\n'
+    b'64 42f0e1eba9ea3693 0 nn 0 6c40df5f0b497347 |ecma_182|crc64|\n'
+    b'64 1b ffffffffffffffff rr ffffffffffffffff b90956c775a41001 |go_iso|\n'
+    b'64 259c84cba6426349 ffffffffffffffff rr 0 75d4b74f024eceea |ms|\n'
+    b'64 ad93d23594c93659 ffffffffffffffff rr ffffffffffffffff ae8b14860a799888 |nvme|\n'
+    b'64 ad93d23594c935a9 0 rr 0 e9c6d914c4b8d9ca |redis|\n'
+    b'64 42f0e1eba9ea3693 ffffffffffffffff nn ffffffffffffffff 62ec59e3f1a4f00a |we|\n'
+    b'64 42f0e1eba9ea3693 ffffffffffffffff rr ffffffffffffffff 995dc9bbdf1939fa |xz|go_ecma|\n'
+)
+
+def _find(nb, name):             # definition tuple of the crc name of storage width nb, None if there is none
+    key = b'|' + name.encode() + b'|'
+    i = _catalog.find(key)
+    while i >= 0:
+        f = _catalog[_catalog.rfind(b'\n', 0, i) + 1:i].decode().split()
+        width = int(f[0])
+        if width <= nb and (nb == 8 or width > nb >> 1):
+            return (width, int(f[1], 16), int(f[2], 16), f[3][0] == 'r', f[3][1] == 'r', int(f[4], 16), int(f[5], 16))
+        i = _catalog.find(key, i + 1)
+    return None
+
+class _Group:                    # Crc8, Crc16, Crc32, Crc64: the catalog crcs of a storage width, as attributes
+    def __init__(self, name, nb):
+        self.__name__ = name
+        self._nb = nb
+
+    def __getattr__(self, name):
+        d = _find(self._nb, name)
+        if d is None:
+            raise AttributeError(name)
+        return d
+
+    def names(self, aliases=False):   # the (first) names of its crcs, or all names and aliases
+        names = []
+        for line in _catalog.split(b'\n'):
+            if line:
+                f = line.split(b'|')
+                width = int(f[0].split()[0])
+                if width <= self._nb and (self._nb == 8 or width > self._nb >> 1):
+                    names.extend(n.decode() for n in (f[1:-1] if aliases else f[1:2]))
+        return names
+
+Crc8 = _Group('Crc8', 8)
+Crc16 = _Group('Crc16', 16)
+Crc32 = _Group('Crc32', 32)
+Crc64 = _Group('Crc64', 64)
+
+def lookup(name):                # definition tuple of a crc by name: 'CRC-16/MODBUS', 'MODBUS', 'Crc16.modbus'
+    if '.' in name:
+        group, name = name.split('.')
+        groups = [g for g in (Crc8, Crc16, Crc32, Crc64) if g.__name__ == group]
+    else:
+        groups = (Crc8, Crc16, Crc32, Crc64)
+        name = name.lower()
+        if name.startswith('crc-') and name[4:5].isdigit():
+            name = 'crc' + name[4:]
+        name = name.replace('/', '_').replace('-', '_')
+    for g in groups:
+        prefix = 'crc%d_' % g._nb
+        d = _find(g._nb, name[len(prefix):] if name.startswith(prefix) else name)
+        if d:
+            return d
+    raise ValueError('crc: unknown crc ' + repr(name))
 
 # --- These are the ordinary MP bytecode implementations of the 8-bit table lookup CRC8 16 and 32 ---
 #
@@ -159,25 +276,408 @@ def _crc16_tr(crc, data, n, tab):   # this is quite universal
 
 _crc64_tr = _crc32_tr = _crc16_tr   # we keep the different names for the optimized implementations
 
+# --- Slicing-by-4 and slicing-by-8 versions, processing 4 or 8 bytes per loop iteration ---
+#
+# The table consists of 4 (or 8) consecutive 256-entry tables T0, T1, .. where Tk[i] is the crc of
+# byte i followed by k zero bytes. The lookups within one block are independent of each other.
+#
+# -- Arguments ---
+# tab  .. lookup table address (256 * slices entries)
+# n    .. number of 4 (or 8) byte blocks to process, the remaining bytes have to be done by _crcXX_tr
+# data .. data to be processed, indexable bytes
+# crc  .. previous crc value to be updated
+def _crc_ts4(crc, data, n, tab):    # universal for all widths, bytes beyond the crc width just see 0
+    i = 0
+    for _ in range(n):
+        crc = ((crc >> 32) ^ tab[768 + ((crc ^ data[i]) & 0xff)] ^ tab[512 + ((crc >> 8 ^ data[i+1]) & 0xff)]
+               ^ tab[256 + ((crc >> 16 ^ data[i+2]) & 0xff)] ^ tab[(crc >> 24 ^ data[i+3]) & 0xff])
+        i += 4
+    return crc
+
+def _crc_ts8(crc, data, n, tab):
+    i = 0
+    for _ in range(n):
+        crc = (tab[1792 + ((crc ^ data[i]) & 0xff)] ^ tab[1536 + ((crc >> 8 ^ data[i+1]) & 0xff)]
+               ^ tab[1280 + ((crc >> 16 ^ data[i+2]) & 0xff)] ^ tab[1024 + ((crc >> 24 ^ data[i+3]) & 0xff)]
+               ^ tab[768 + ((crc >> 32 ^ data[i+4]) & 0xff)] ^ tab[512 + ((crc >> 40 ^ data[i+5]) & 0xff)]
+               ^ tab[256 + ((crc >> 48 ^ data[i+6]) & 0xff)] ^ tab[(crc >> 56 ^ data[i+7]) & 0xff])
+        i += 8
+    return crc
+
+_crc8_ts4 = _crc16_ts4 = _crc32_ts4 = _crc64_ts4 = _crc_ts4
+_crc8_ts8 = _crc16_ts8 = _crc32_ts8 = _crc64_ts8 = _crc_ts8
+
+# --- Low memory versions: 16-entry table, two lookups per byte (nibble), or bit by bit with the polynomial ---
+#
+# The reflected (refin) versions _crcXX_nr and _crcXX_br work on the reflected register like the above.
+# The non-reflected versions _crcXX_nl and _crcXX_bl work on the register left aligned in 32 bits
+# (widths up to 32) or 64 bits, shifting left. There are only 32 and 64 bit versions of these.
+#
+# -- Arguments ---
+# tab  .. 16-entry nibble table, or the (reflected or left aligned) polynomial in tab[0] for the bitwise versions
+# n    .. (length of data, will be ignored here, but is there for the optimized versions)
+# data .. data to be processed, iterable of bytes
+# crc  .. previous crc value to be updated
+def _crc_nr(crc, data, n, tab):
+    for d in data:
+        crc ^= d
+        crc = (crc >> 4) ^ tab[crc & 0xf]
+        crc = (crc >> 4) ^ tab[crc & 0xf]
+    return crc
+
+def _crc32_nl(crc, data, n, tab):
+    for d in data:
+        crc ^= d << 24
+        crc = (crc << 4 & 0xffffffff) ^ tab[crc >> 28]
+        crc = (crc << 4 & 0xffffffff) ^ tab[crc >> 28]
+    return crc
+
+def _crc64_nl(crc, data, n, tab):
+    for d in data:
+        crc ^= d << 56
+        crc = (crc << 4 & 0xffffffffffffffff) ^ tab[crc >> 60]
+        crc = (crc << 4 & 0xffffffffffffffff) ^ tab[crc >> 60]
+    return crc
+
+def _crc_br(crc, data, n, tab):
+    poly = tab[0]
+    for d in data:
+        crc ^= d
+        for _ in range(8):
+            crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+    return crc
+
+def _crc32_bl(crc, data, n, tab):
+    poly = tab[0]
+    for d in data:
+        crc ^= d << 24
+        for _ in range(8):
+            crc = (crc << 1 & 0xffffffff) ^ poly if crc & 0x80000000 else crc << 1 & 0xffffffff
+    return crc
+
+def _crc64_bl(crc, data, n, tab):
+    poly = tab[0]
+    for d in data:
+        crc ^= d << 56
+        for _ in range(8):
+            crc = (crc << 1 & 0xffffffffffffffff) ^ poly if crc >> 63 else crc << 1 & 0xffffffffffffffff
+    return crc
+
+_crc32_nr = _crc64_nr = _crc_nr
+_crc32_br = _crc64_br = _crc_br
+
+# --- The C crc32 of binascii (zlib), used for crcs with its reflected polynomial 0x04c11db7, on CPython by default ---
+#
+# It keeps the register inverted, so any init and xorout are possible by inverting it before and after.
+try:
+    from binascii import crc32 as _binascii_crc32
+except ImportError:
+    _binascii_crc32 = None
+
+def _crc32_zr(crc, data, n, tab):
+    return _binascii_crc32(data, crc ^ 0xffffffff) ^ 0xffffffff
+
+# --- Batch versions: crcs of many frames in one buffer, see Calculator.checksum_packed() ---
+#
+# Only the viper and asm_thumb implementations have them, for storage widths 8, 16 and 32.
+_crc8_tp = _crc16_tp = _crc32_tp = None
+
+# --- Rolling crc scan over a buffer, see rolling.py ---
+#
+# Only the viper implementation has them, for storage widths 8, 16 and 32.
+_crc8_rs = _crc16_rs = _crc32_rs = None
+
+# --- Copy and digest in one loop, see Calculator.digest_into() ---
+#
+# Only the viper and asm_thumb implementations have them, for storage widths 8, 16 and 32.
+_crc8_tc = _crc16_tc = _crc32_tc = None
+
+# --- Digest of several buffers in one call, see Calculator.digest_iov() ---
+#
+# Only the viper (all storage widths) and asm_thumb (8, 16 and 32) implementations have them.
+_crc8_ti = _crc16_ti = _crc32_ti = _crc64_ti = None
+
+# --- Register kept in a buffer (crc[0]) between the calls, see Calculator.checksum_into() ---
+#
+# The viper and asm_thumb implementations have them (byte tables, with slices), asm_xtensa without slices.
+_crc32_h = _crc64_h = _crc32_hs4 = _crc64_hs4 = _crc32_hs8 = _crc64_hs8 = None
+
+# ----- Backends -----
+#
+# A backend is a set of the above kernels, implemented with one of the micropython code emitters in the module
+# Opt_<name>, which registers it on import. Kernels it lacks are taken from the bytecode backend.
+# Each calculator takes its kernels from the backend given to it, or from the default backend (Implementation),
+# which is the last one imported explicitly (e.g. from crc import Opt_viper), as in former versions, or set_default().
+# A module is imported only once: after a lazy import (backend='viper', available_backends()) an explicit import
+# of it does not run it again and so does not change the default, set_default() does.
+
+_kernel_names = ('_crc8_tr', '_crc16_tr', '_crc32_tr', '_crc64_tr',
+                 '_crc8_ts4', '_crc16_ts4', '_crc32_ts4', '_crc64_ts4', '_crc8_ts8', '_crc16_ts8', '_crc32_ts8', '_crc64_ts8',
+                 '_crc32_nr', '_crc64_nr', '_crc32_nl', '_crc64_nl', '_crc32_br', '_crc64_br', '_crc32_bl', '_crc64_bl',
+                 '_crc8_tp', '_crc16_tp', '_crc32_tp', '_crc8_rs', '_crc16_rs', '_crc32_rs',
+                 '_crc8_tc', '_crc16_tc', '_crc32_tc', '_crc8_ti', '_crc16_ti', '_crc32_ti', '_crc64_ti',
+                 '_crc32_h', '_crc64_h', '_crc32_hs4', '_crc64_hs4', '_crc32_hs8', '_crc64_hs8')
+_backends = {'bytecode': {name: globals()[name] for name in _kernel_names}}   # name -> kernels
+_ptr_kernels = []   # kernels taking the data address as int (viper, asm)
+try:
+    from sys import maxsize as _maxsize
+except ImportError:
+    _maxsize = 0x7fffffff
+_addr32 = _maxsize < 1 << 32   # addresses fit into array('I'), as the kernels with control arrays (tp, tc, ti, rs) need
+_checked = {}       # (backend, storage width) -> passed the self test
+_auto = {}          # storage width -> backend chosen for 'auto'
+auto_benchmark = False   # 'auto' times the working backends, instead of taking the first one of the platform
+
 Implementation = 'bytecode'
 
+def _register(name, kernels, addressed=False):   # called by the Opt_ modules with their globals()
+    k = dict(_backends['bytecode'])
+    for kname in _kernel_names:
+        if kname in kernels:
+            k[kname] = kernels[kname]
+            if addressed:
+                _ptr_kernels.append(kernels[kname])
+    _backends[name] = k
+    _set_default(name)                            # the imported backend becomes the default
+
+def _set_default(name):
+    global Implementation
+    Implementation = name
+    globals().update(_backends[name])             # the module level kernels are its ones, as before
+
+def set_default(name):                            # backend of the calculators created without one, imported if necessary
+    _backend(name)
+    _set_default(name)
+
+def _backend(name):                               # kernels of the backend, importing it if necessary
+    if name not in _backends:
+        if name not in ('native', 'viper', 'asm_thumb', 'asm_xtensa'):
+            raise ValueError('crc: unknown backend ' + repr(name))
+        default = Implementation
+        try:
+            __import__('crc.Opt_' + name)
+        finally:
+            _set_default(default)                 # a lazy import does not change the default
+    return _backends[name]
+
+from sys import implementation as _sys_implementation
+
+def _platform_backends():                         # candidates on this platform, the fastest first
+    if _sys_implementation.name != 'micropython':
+        return ('bytecode',)
+    arch = getattr(_sys_implementation, '_mpy', 0) >> 10   # native code architecture, 0 if there is none
+    if 3 <= arch <= 8:                            # armv6 .. armv7emdp
+        return ('asm_thumb', 'viper', 'native', 'bytecode')
+    if arch == 9:                                 # xtensa (esp8266), xtensawin (esp32) lacks asm_xtensa
+        return ('asm_xtensa', 'viper', 'native', 'bytecode')
+    return ('viper', 'native', 'bytecode') if arch else ('bytecode',)
+
+_selftest = {8: (Crc8.crc8, Crc8.maxim_dow), 16: (Crc16.xmodem, Crc16.modbus),
+             32: (Crc32.bzip2, Crc32.crc32), 64: (Crc64.crc64, Crc64.go_iso)}
+
+def _works(name, nb):                             # backend imports and computes correct crcs of storage width nb
+    key = (name, nb)
+    if key not in _checked:
+        try:
+            ok = True
+            for d in _selftest[nb]:
+                for table in ('byte', 'nibble', None):    # all kinds of kernels
+                    c = Calculator(d, table=table, backend=name)
+                    ok = ok and c.checksum(b'123456789') == d[6]
+                    c.release()
+        except Exception:                         # emitter not available on this port
+            ok = False
+        _checked[key] = ok
+    return _checked[key]
+
+def available_backends():                         # backends working on this platform (for all widths)
+    return [name for name in _platform_backends() if all(_works(name, nb) for nb in (8, 16, 32, 64))]
+
+def _bench(name, nb):
+    from time import ticks_us, ticks_diff
+    c = Calculator(_selftest[nb][0], backend=name)
+    data = bytes(1024)
+    t0 = ticks_us()
+    c.digest(data)
+    t = ticks_diff(ticks_us(), t0)
+    c.release()
+    return t
+
+def _auto_backend(nb):                            # the fastest working backend for storage width nb
+    if nb not in _auto:
+        names = [name for name in _platform_backends() if _works(name, nb)]
+        if auto_benchmark and len(names) > 1:
+            names.sort(key=lambda name: _bench(name, nb))
+        _auto[nb] = names[0]
+    return _auto[nb]
+
+# ----- GF(2) matrix operations, used to combine crcs -----
+#
+# A matrix is a list of its columns: mat[j] is the image of the unit vector 1 << j
+
+def _gf2_times(mat, vec):
+    s = 0
+    j = 0
+    while vec:
+        if vec & 1:
+            s ^= mat[j]
+        vec >>= 1
+        j += 1
+    return s
+
+def _gf2_square(mat):
+    return [_gf2_times(mat, v) for v in mat]
+
+# ----- Lookup tables -----
+#
+# Calculators with the same (width, poly, refin, kind) share one lookup table, that must not be modified.
+# kind is the number of slices of a byte table (1, 4 or 8), 'nibble' or None (bitwise, just the polynomial).
+# Tables no longer used by any calculator are kept for reuse: up to table_cache_max of them, the oldest
+# are dropped first. Pinned tables are kept in any case.
+
+_tabtypes = {8: ('B', rbit8, rbyte1), 16: ('H', rbit16, rbyte2), 32: ('I', rbit32, rbyte4), 64: ('Q', rbit64, rbyte8)}
+
+# Crcs with other widths than 8, 16, 32 or 64 are kept in the next of these sizes (storage width).
+# The not reflected register is left aligned there, the reflected one is right aligned.
+def _storage(width):
+    return 8 if width <= 8 else 16 if width <= 16 else 32 if width <= 32 else 64
+
+def _rbitw(v, width):        # bit reverse of the lowest width bits
+    nb = _storage(width)
+    return _tabtypes[nb][1](v) >> (nb - width)
+
+def _mktab(width, poly, refin, kind, tab=None):     # compute a lookup table, into tab if given
+    if kind == 'nibble' or kind is None:
+        return _mktab_small(width, poly, refin, kind, tab)
+    nb = _storage(width)
+    tab_tc, rbit, rbyte = _tabtypes[nb]
+    slices = kind
+    if tab is None:
+        tab = array(tab_tc, (0 for _ in range(256 * slices)))
+    rpoly = _rbitw(poly, width)                           # fill it, depending on input reflection
+    poly <<= nb - width
+    tab[0] = 0
+    p = 1
+    while p < 256:                                        # the table is linear: only the powers of 2 need the bit loop,
+        v = tab[p] = _tinit_r(p, rpoly) if refin else rbyte(_tinit_l(p, poly, nb))
+        for i in range(1, p):                             # the other entries are xors of them
+            tab[p + i] = v ^ tab[i]
+        p <<= 1
+    for i in range(256, 256 * slices):                    # Tk[i] = crc of Tk-1[i] followed by a zero byte
+        v = tab[i - 256]
+        tab[i] = (v >> 8) ^ tab[v & 0xff]
+    return tab
+
+def _mktab_small(width, poly, refin, kind, tab=None):   # nibble table or polynomial for the bitwise versions
+    nb = 64 if width > 32 else 32                     # the register is kept in 32 or 64 bits
+    if refin:
+        poly = _rbitw(poly, width)                    # reflected polynomial, register shifts right
+    else:
+        poly <<= nb - width                           # left aligned polynomial, register shifts left
+    if tab is None:
+        tab = array('Q' if nb == 64 else 'I', (0 for _ in range(16 if kind else 1)))
+    if not kind:
+        tab[0] = poly
+        return tab
+    top = 1 << (nb - 1)
+    for i in range(16):
+        crc = i if refin else i << (nb - 4)
+        for _ in range(4):
+            if refin:
+                crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+            else:
+                crc = (crc << 1 ^ poly if crc & top else crc << 1) & (top * 2 - 1)
+        tab[i] = crc
+    return tab
+
+table_cache_max = 4     # number of unused tables kept for reuse
+_tables = {}            # (width, poly, refin, kind) -> [table, number of users, pinned]
+_unused = []            # keys of unused, unpinned tables, oldest first
+
+def _acquire_table(key):
+    entry = _tables.get(key)
+    if entry is None:
+        entry = _tables[key] = [_mktab(*key), 0, False]
+    elif key in _unused:
+        _unused.remove(key)
+    entry[1] += 1
+    return entry[0]
+
+def _drop_unused(key):
+    entry = _tables[key]
+    if entry[1] == 0 and not entry[2] and key not in _unused:
+        _unused.append(key)
+        while len(_unused) > table_cache_max:
+            del _tables[_unused.pop(0)]
+
+def _release_table(key):
+    _tables[key][1] -= 1
+    _drop_unused(key)
+
+def _tabkey(width, poly=None, init=None, refin=False, refout=False, xorout=0, check=None, tab=None, slices=1,
+            table='byte'):
+    if isinstance(width, str):
+        width = lookup(width)
+    if isinstance(width, tuple):
+        width, poly, refin = width[0], width[1], width[3]
+    elif isinstance(width, dict):
+        width, poly, refin = width['width'], width['poly'], width['refin']
+    return (width, poly, refin, slices if table == 'byte' else table)
+
+def pin_table(*args, **kwargs):      # same arguments as Calculator, the table is kept even if unused
+    key = _tabkey(*args, **kwargs)
+    _acquire_table(key)
+    _tables[key][2] = True
+    _release_table(key)
+
+def unpin_table(*args, **kwargs):
+    key = _tabkey(*args, **kwargs)
+    if key in _tables:
+        _tables[key][2] = False
+        _drop_unused(key)
+
+def table_cache_clear():             # drop all unused (and unpinned) tables
+    while _unused:
+        del _tables[_unused.pop()]
+
+# --- Threads, for Calculator.checksum_split() on the ports that have them ---
+#
+# The lock guards what calculators build lazily and threads may share: the table (cache) and the operators of _shift().
+try:
+    import _thread
+    _lock = _thread.allocate_lock()
+except ImportError:
+    _thread = _lock = None
+
 class Calculator:
     """
     Micropython CRC computation class
     """
     # Arguments:
     #
-    # width  .. The width of CRC calculation (16 or 32)
+    # width  .. The width of CRC calculation (1 .. 64), or the definition as tuple, dict or catalog name (see lookup())
     # poly   .. The CRC polynomial
     # init   .. Initial CRC value.
     # refin  .. True if input bytes are to be reflected before processing (bit7 <--> bit0, bit6 <--> bit1, etc). Default: False.
     # refout .. True if computed CRC is to be reflected after processing. Default: False
     # xorout .. 16-bit word, that is Xor'ed to the computed CRC after processing the bit shifts. Default: 0
     # check  .. CRC expected in processing the bytes b'\x31\x32\x33\x34\x35\x36\x37\x38\x39' (123456789 in Ascii). Default: None
-    # tab    .. optional array, where the lookup table will be stored in, needs to have the proper typecode (e.g. 'H')
+    # tab    .. optional array, where the lookup table will be stored in, needs to have the proper typecode (e.g. 'H').
+    #           If not given, the calculator uses a shared table. Call release() when the calculator is no longer needed.
+    #           A bytes object is taken as precomputed table (little endian, see gentab.py) and used as it is.
+    # slices .. 1, 4 or 8: number of bytes processed per loop iteration. 4 and 8 need 4 or 8 times the table size.
+    # table  .. 'byte': 256-entry lookup table (default), 'nibble': 16-entry table with two lookups per byte,
+    #           None: bit by bit computation without table. The latter two need much less memory, but are slower.
+    # backend .. 'bytecode', 'native', 'viper', 'asm_thumb', 'asm_xtensa' or 'auto' (the fastest working one of the
+    #           platform). Default: None, the last imported Opt_ module (or set_default()), or 'bytecode'.
+    #           'binascii': binascii.crc32 (C), only for the reflected crc32 polynomial, without tab. On CPython it is
+    #           taken for these by default (and for 'auto'), other crcs fall back to the table computation.
     #
-    def __init__(self, width, poly=None, init=None, refin=False, refout=False, xorout=0, check=None, tab=None):
+    def __init__(self, width, poly=None, init=None, refin=False, refout=False, xorout=0, check=None, tab=None, slices=1,
+                 table='byte', backend=None):
         
+        if isinstance(width, str):      # name of a catalog crc, see lookup()
+            width = lookup(width)
         if isinstance(width, tuple):
             if len(width) == 7:    # if we have a tuple containing all the args
                 width, poly, init, refin, refout, xorout, check = width
@@ -195,55 +695,443 @@ class Calculator:
         self.refout = refout
         self.xorout = xorout
         self.check = check
-        self.implementation = Implementation
+        self.slices = slices
         
-        if width == 8:
-            self._crcfun = _crc8_tr    # bytecode implementations, unless overwritten before
-            tab_tc = 'B'
-            self._rbit = rbit8
-            self._rbyte = rbyte1
-        elif width == 16:
-            self._crcfun = _crc16_tr   # bytecode implementations, unless overwritten before
-            tab_tc = 'H'
-            self._rbit = rbit16
-            self._rbyte = rbyte2
-        elif width == 32:
-            self._crcfun = _crc32_tr
-            tab_tc = 'I'
-            self._rbit = rbit32
-            self._rbyte = rbyte4
-        elif width == 64:
-            self._crcfun = _crc64_tr
-            tab_tc = 'Q'
-            self._rbit = rbit64
-            self._rbyte = rbyte8
-
-        else:
-            raise ValueError('crc.Calculator: width was not 8, 16, 32 or 64')
+        if not 0 < width <= 64:
+            raise ValueError('crc.Calculator: width was not 1 .. 64')
+        nb = _storage(width)                                  # 8, 16, 32 or 64
+        if slices not in (1, 4, 8):                           # checked before any backend may override them
+            raise ValueError('crc.Calculator: slices was not 1, 4 or 8')
+        if table != 'byte' and (table not in ('nibble', None) or slices != 1):
+            raise ValueError("crc.Calculator: table was not 'byte', 'nibble' or None (without slices)")
+        if backend in (None, 'auto', 'binascii'):
+            if (width == 32 and poly == 0x04c11db7 and refin and tab is None and table == 'byte' and _binascii_crc32
+                    and (backend == 'binascii' or _sys_implementation.name != 'micropython')):
+                backend = 'binascii'
+                self.slices = slices = 1
+            elif backend == 'binascii':
+                backend = None
+        if backend == 'auto':
+            backend = _auto_backend(nb)
+        self.implementation = backend or Implementation
+        k = _backend('bytecode' if backend == 'binascii' else self.implementation)   # its kernels
+        self._crcfun = k['_crc%d_tr' % nb]
+        self._crcfun_s = k['_crc%d_ts%d' % (nb, 8 if slices == 8 else 4)]
+        self._rbit, self._rbyte = _tabtypes[nb][1:]
+        self.table = table
+        self._toreg = self._fromreg = self._rbyte             # conversions of the (not reflected) register
+        self._regbits = nb
+        sh = nb - width
+        if sh:                                                # register left aligned in storage width
+            rbit, rbyte = self._rbit, self._rbyte
+            self._rbit = lambda v: rbit(v) >> sh
+            self._toreg = lambda v: rbyte(v << sh)
+            self._fromreg = lambda v: rbyte(v) >> sh
+        kind = slices                                         # kind of lookup table
+        if table != 'byte':
+            kind = table
+            wide = width > 32
+            self._crcfun = k['_crc%d_%s%s' % (64 if wide else 32, 'n' if table else 'b', 'r' if refin else 'l')]
+            if not refin:
+                self._regbits = 64 if wide else 32            # register is left aligned
+                sh = self._regbits - width
+                self._toreg = lambda v: v << sh
+                self._fromreg = lambda v: v >> sh
+        if backend == 'binascii':                             # no table needed
+            self._crcfun = _crc32_zr
+            kind = 0
             
-        if tab:
-            self._tab = tab                                   # needs to be checked for typecode, length !!!!
+        self._ptr = (addressof is not None and self._crcfun in _ptr_kernels   # data may be passed by address
+                     and (slices == 1 or self._crcfun_s in _ptr_kernels))
+        if isinstance(tab, bytes):                            # precomputed table, e.g. frozen in flash
+            self._tabkey = None
+            if not self._ptr:                                 # the bytecode and native kernels index the table as array
+                tab = array(_tabtypes[nb][0] if kind == slices else 'Q' if width > 32 else 'I', tab)
+            self._tab = tab
+        elif tab:
+            self._tabkey = None
+            self._tab = _mktab(width, poly, refin, kind, tab)     # needs to be checked for typecode, length !!!!
+        elif kind == 0:
+            self._tabkey = self._tab = None
         else:
-            self._tab = array(tab_tc, 0 for _ in range(256))  # create lookup table 
-
-        rpoly = self._rbit(poly)                              # and fill it, depending on input reflection
-        for i in range(256):
-            self._tab[i] = _tinit_r(i, rpoly) if self.refin else self._rbyte(_tinit_l(i, poly, width))
+            self._tabkey = (width, poly, refin, kind)         # shared lookup table, taken on first use
+            self._tab = None
+        self._lazy = self._tabkey is not None
             
+        self._direct = refin and refout                       # the register is the crc (before xorout)
+        self._outreg, self._inreg = self._fromreg, self._toreg     # conversions register <-> crc (before xorout)
+        if refin and not refout:                              # the reflected register, reflected once more
+            self._outreg = self._inreg = self._rbit
+        elif refout and not refin:
+            fromreg, toreg = self._fromreg, self._toreg
+            self._outreg = lambda v: _rbitw(fromreg(v), width)
+            self._inreg = lambda v: toreg(_rbitw(v, width))
+        self._reg0 = self._rbit(init) if refin else self._toreg(init)       # initial register
+        self._tpfun = None
+        if self._ptr and _addr32 and kind == slices and nb <= 32 and refin == refout:
+            self._tpfun = k['_crc%d_tp' % nb]
+        if self._tpfun:                                       # its parameters, see checksum_packed()
+            self._ctl = array('I', (self._reg0, xorout if refout else self._toreg(xorout),
+                                    not refout and nb > 8, 0 if refout else sh, 0, 0, 0, 0))
+        self._tcfun = None
+        if self._ptr and _addr32 and table == 'byte' and nb <= 32:
+            self._tcfun = k['_crc%d_tc' % nb]
+        if self._tcfun:                                       # table and destination address, see digest_into()
+            self._cctl = array('I', (0, 0))
+        self._tifun = None
+        if self._ptr and _addr32 and table == 'byte' and slices == 1:
+            self._tifun = k['_crc%d_ti' % nb]
+        self._hfun = self._hreg = self._hbytes = None
+        if self._ptr and table == 'byte' and nb >= 32:
+            self._hfun = k['_crc%d_h' % nb]
+            self._hfun_s = k['_crc%d_hs%d' % (nb, 8 if slices == 8 else 4)]
+            if slices > 1 and not self._hfun_s:
+                self._hfun = None
+        if self._hfun:                                        # register kept in a buffer, see checksum_into()
+            self._hreg = array(_tabtypes[nb][0], (self._reg0, 0))   # 2nd entry: room for the asm_thumb kernels
+            if refin == refout and (refin or width % 8 == 0):     # its bytes are the crc bytes (before xorout)
+                self._hbytes = bytearray_at(addressof(self._hreg), nb // 8)
+                self._xbytes = self._register(0).to_bytes(nb // 8, 'little')
+            if self._lazy:                                    # taken now, so digest() never allocates or waits for _lock
+                self._table()
+        self._iov = None                                      # addresses and lengths, see digest_iov()
+        self._residue = None                                  # see verify()
+        self._ops = None                                      # operators of 1, 2, 4, ... zero bytes, see _shift()
         self.reset()                
         
-    def digest(self, data):
-        self._crc = self._crcfun(self._crc, data, len(data), self._tab)    # this always updates self._crc
+    def _table(self):                                         # take the shared table, computing it if not cached
+        if _lock:
+            _lock.acquire()
+        try:
+            if self._lazy:                                    # not yet taken by another thread
+                self._tab = _acquire_table(self._tabkey)
+                self._lazy = False
+        finally:
+            if _lock:
+                _lock.release()
+        return self._tab
+
+    def digest(self, data, start=0, end=None):                # digests data[start:end], without copying it
+        if self._hreg is None:
+            self._crc = self._update(self._crc, data, start, end)
+            return
+        size = len(data)                                      # the same as _update(), in place: no allocations
+        if end is None:
+            end = size
+        if not 0 <= start <= end <= size:
+            raise ValueError('crc.Calculator: start, end out of range')
+        n = end - start
+        data = addressof(data) + start
+        s = self.slices
+        if n >= s > 1:
+            nb = n // s
+            self._hfun_s(self._hreg, data, nb, self._tab)
+            n -= nb * s
+            data += nb * s
+        if n:
+            self._hfun(self._hreg, data, n, self._tab)
+
+    def _running(self):                                       # the running register
+        return self._crc if self._hreg is None else self._hreg[0]
+
+    def _set_running(self, reg):
+        if self._hreg is None:
+            self._crc = reg
+        else:
+            self._hreg[0] = reg
+
+    def _update(self, crc, data, start=0, end=None):          # register crc after data[start:end]
+        if self._lazy:
+            self._table()
+        size = len(data)
+        if end is None:
+            end = size
+        if not 0 <= start <= end <= size:
+            raise ValueError('crc.Calculator: start, end out of range')
+        n = end - start
+        if self._ptr:                                         # address plus offset, no slice object
+            data = addressof(data) + start
+        elif end - start < size:
+            data = memoryview(data)[start:end]
+        s = self.slices
+        if n >= s > 1:                                        # process the blocks, then the remaining tail
+            nb = n // s
+            crc = self._crcfun_s(crc, data, nb, self._tab)
+            n -= nb * s
+            if not n:
+                return crc
+            data = data + nb * s if self._ptr else memoryview(data)[-n:]
+        if n:                                                 # the asm versions need n > 0
+            crc = self._crcfun(crc, data, n, self._tab)
+        return crc
+
+    def _value(self, reg):                                    # crc of the register
+        return (reg if self._direct else self._outreg(reg)) ^ self.xorout
+
+    def _register(self, crc):                                 # register of the crc
+        crc ^= self.xorout
+        return crc if self._direct else self._inreg(crc)
+
+    def new(self, data=None):                                 # running crc of one stream, see CrcState
+        state = CrcState(self, self._reg0)
+        if data:
+            state.update(data)
+        return state
+
+    # crc after data[start:end], from the crc before it (None: the start of the data), like binascii.crc32().
+    # The running crc of the calculator is not changed, so one calculator serves any number of streams.
+    def update(self, crc, data, start=0, end=None):
+        return self._value(self._update(self._reg0 if crc is None else self._register(crc), data, start, end))
+
+    # digests the buffers (list or tuple), one after the other. The viper and asm_thumb implementations do it in one
+    # call, so the register stays there between the buffers.
+    def digest_iov(self, buffers):
+        if self._lazy:
+            self._table()
+        if not self._tifun:
+            for data in buffers:
+                self.digest(data)
+            return
+        m = len(buffers)
+        iov = self._iov
+        if iov is None or len(iov) < 2 * m:                   # kept for the next call
+            iov = self._iov = array('I', bytes(8 * m))
+        j = 0
+        for data in buffers:
+            iov[j] = addressof(data)
+            iov[j + 1] = len(data)
+            j += 2
+        if m:
+            self._set_running(self._tifun(self._running(), iov, m, self._tab))
+
+    # copies src[:n] (default: all of src) to dst[:n] and digests it. The viper and asm_thumb implementations do both
+    # in one loop (crcs up to 32 bits), so the data is read from memory once. Otherwise it is copied, then digested.
+    def digest_into(self, dst, src, n=None):
+        if n is None:
+            n = len(src)
+        if not 0 <= n <= len(src) or n > len(dst):
+            raise ValueError('crc.Calculator: n out of range')
+        if self._lazy:
+            self._table()
+        if self._tcfun:
+            if n:
+                ctl = self._cctl
+                ctl[0] = addressof(self._tab)
+                ctl[1] = addressof(dst)
+                self._set_running(self._tcfun(self._running(), addressof(src), n, ctl))
+            return
+        memoryview(dst)[:n] = memoryview(src)[:n]
+        self.digest(dst, 0, n)
+
+    def digest_readinto(self, stream, buf):                   # digests stream until EOF (or timeout), returns the length
+        total = 0                                             # buf is preallocated, no allocations per chunk
+        while True:
+            n = stream.readinto(buf)
+            if not n:
+                return total
+            self.digest(buf, 0, n)
+            total += n
+
+    def digest_stream(self, stream, bufsize=256):             # same, with a buffer of bufsize allocated once
+        return self.digest_readinto(stream, bytearray(bufsize))
         
     def checksum(self, data=None):                            # includes a reset; if this is not desrired use digest()
         if data:
             self.digest(data)
-        rcrc = self._crc if self.refout else self._rbyte(self._crc)
+        crc = self._value(self._running())
+        self.reset()
+        return crc
+
+    # writes the crc to buf[:n], n = ceil(width / 8), little endian for crcs with refout, big endian otherwise, unless
+    # byteorder is given, and returns n. Includes a reset.
+    # With the viper and asm implementations crcs of 32 and 64 bits keep their register in a buffer of the calculator.
+    # digest() and checksum_into() allocate nothing then (as for smaller crcs), so they can run in interrupt handlers.
+    def checksum_into(self, buf, byteorder=None):
+        n = (self.width + 7) // 8
+        natural = 'little' if self.refout else 'big'
+        order = byteorder or natural
+        reg = self._hbytes
+        if reg is None:                                       # from the crc value
+            crc = self.checksum()
+            for i in range(n):
+                buf[n - 1 - i if order == 'big' else i] = crc & 0xff
+                crc >>= 8
+            return n
+        x = self._xbytes                                      # byte by byte, from the register (natural order)
+        rev = order != natural
+        for i in range(n):
+            buf[n - 1 - i if rev else i] = reg[i] ^ x[i]
+        self.reset()
+        return n
+
+    # True if frame is data followed by its crc (ceil(width / 8) bytes, little endian for crcs with refout, big endian
+    # otherwise, unless byteorder is given). Includes a reset.
+    # The crc computed over data and crc together is the same for all data, the residue. So frames are checked in one
+    # pass, without taking the crc apart. Otherwise (crcs with refin != refout, non-reflected ones with a width
+    # that is not a multiple of 8, other byte orders) the data and the crc are compared separately.
+    def verify(self, frame, byteorder=None):
+        nbytes = (self.width + 7) // 8
+        n = len(frame) - nbytes
+        if n < 0:
+            return False
+        natural = 'little' if self.refout else 'big'
+        if self._residue is None:
+            self._residue = self._mkresidue(nbytes, natural)
         self.reset()
-        return rcrc ^ self.xorout
+        if self._residue is not False and byteorder in (None, natural):
+            return self._update(self._reg0, frame) == self._residue
+        self.digest(frame, 0, n)
+        return int.from_bytes(frame[n:], byteorder or natural) == self.checksum()
+
+    def _mkresidue(self, nbytes, byteorder):                  # register after data and its crc, False if it depends on the data
+        if self.refin != self.refout or not (self.refin or self.width % 8 == 0):
+            return False
+        return self._update(self._reg0, self._value(self._reg0).to_bytes(nbytes, byteorder))   # no data and its crc
+
+    def peek(self):                                           # crc of the data digested so far, without a reset
+        return self._value(self._running())
+
+    def checksum_many(self, buffers):                         # list of the crcs of buffers, less overhead than checksum()
+        if self._lazy:
+            self._table()
+        crcfun, tab, reg0, ptr, s = self._crcfun, self._tab, self._reg0, self._ptr, self.slices
+        fromreg = None if self._direct else self._outreg
+        xorout = self.xorout
+        crcs = []
+        for data in buffers:
+            n = len(data)
+            if s > 1:
+                crc = self._update(reg0, data)
+            else:
+                crc = crcfun(reg0, addressof(data) if ptr else data, n, tab) if n else reg0
+            crcs.append((crc if fromreg is None else fromreg(crc)) ^ xorout)
+        self.reset()
+        return crcs
+
+    # out[i] = crc of buf[offsets[i]:offsets[i] + lengths[i]], for all i. With the viper and asm_thumb implementations
+    # the whole loop runs there, offsets and lengths have to be array('I') then, out an array of the crc storage size
+    # ('B', 'H' or 'I'). The frames are not checked to lie within buf.
+    def checksum_packed(self, buf, offsets, lengths, out):
+        n = len(offsets)
+        if self._lazy:
+            self._table()
+        if self._tpfun:
+            if n:
+                ctl = self._ctl
+                ctl[4] = addressof(offsets)
+                ctl[5] = addressof(lengths)
+                ctl[6] = addressof(out)
+                self._tpfun(ctl, buf, n, self._tab)
+            return out
+        crcfun, tab, reg0 = self._crcfun, self._tab, self._reg0   # the byte kernel works on sliced tables, too
+        fromreg = None if self._direct else self._outreg
+        xorout = self.xorout
+        mv = memoryview(buf)
+        for i in range(n):
+            o, m = offsets[i], lengths[i]
+            crc = crcfun(reg0, mv[o:o + m], m, tab) if m else reg0
+            out[i] = (crc if fromreg is None else fromreg(crc)) ^ xorout
+        return out
+
+    # same as checksum(buffer), with parts of buffer digested in parallel: one by the calling thread, the others by
+    # threads - 1 _thread workers (e.g. on the second core of RP2040 and ESP32 boards). Their crcs are combined.
+    # Without _thread it is checksum(buffer).
+    # The kernels keep their state in their arguments, so any number of threads may call update() (or use CrcState
+    # objects) of one calculator. digest() and the other methods with the running crc need a calculator per thread.
+    def checksum_split(self, buffer, threads=2):
+        n = len(buffer)
+        if _thread is None or threads < 2 or n < threads:
+            return self.checksum(buffer)
+        if self._lazy:                                        # take the table before the workers use it
+            self._table()
+        m = n // threads
+        crcs = [None] * threads
+        locks = []
+        for i in range(1, threads):
+            lock = _thread.allocate_lock()
+            lock.acquire()                                    # released by the worker when done
+            locks.append(lock)
+            _thread.start_new_thread(self._split_part, (buffer, i * m, n if i == threads - 1 else (i + 1) * m,
+                                                        crcs, i, lock))
+        crc = self.update(None, buffer, 0, m)
+        for lock in locks:
+            lock.acquire()
+        for i in range(1, threads):
+            if crcs[i] is None:
+                raise RuntimeError('crc.Calculator: checksum_split worker failed')
+            crc = self.combine(crc, crcs[i], n - (threads - 1) * m if i == threads - 1 else m)
+        if self._running() != self._reg0:                     # data digested before
+            crc = self.combine(self.peek(), crc, n)
+        self.reset()
+        return crc
+
+    def _split_part(self, buffer, start, end, crcs, i, lock):   # run by a worker of checksum_split()
+        try:
+            crcs[i] = self.update(None, buffer, start, end)
+        finally:
+            lock.release()
 
     def reset(self):
-        self._crc = self._rbit(self.init) if self.refout else self._rbyte(self.init)
+        self._set_running(self._reg0)
+
+    def combine(self, crc_a, crc_b, len_b):                   # crc of data A followed by B, from the crcs of A, B and len(B)
+        reg = self._register(crc_a) ^ self._reg0              # register after A, crc_b already contains init
+        reg = self._shift(reg, len_b)
+        return (reg if self._direct else self._outreg(reg)) ^ crc_b
+
+    # crc of data after data[offset:offset + len(old_bytes)] was replaced by new_bytes, from its crc old_crc and
+    # total_len = len(data). The crc is linear, so the change is the crc of old_bytes ^ new_bytes (without init and
+    # xorout), followed by the zeros up to the end: O(len(new_bytes) + log(total_len)) steps.
+    def update_patch(self, old_crc, total_len, offset, old_bytes, new_bytes):
+        m = len(new_bytes)
+        if len(old_bytes) != m or not 0 <= offset <= total_len - m:
+            raise ValueError('crc.Calculator: patch out of range or of different length')
+        delta = bytearray(m)
+        for i in range(m):
+            delta[i] = old_bytes[i] ^ new_bytes[i]
+        reg = self._shift(self._update(0, delta), total_len - offset - m)
+        return old_crc ^ (reg if self._direct else self._outreg(reg))
+
+    def _shift(self, reg, n):                                 # register after n zero bytes, O(log(n)) steps
+        ops = self._ops
+        i = 0
+        while n:
+            if ops is None or i == len(ops):
+                ops = self._more_ops(i)
+            if n & 1:
+                reg = _gf2_times(ops[i], reg)
+            n >>= 1
+            i += 1
+        return reg
+
+    def _more_ops(self, i):                                   # operators of 1, 2, 4, .. 2 ** i zero bytes
+        if self._lazy:
+            self._table()
+        if _lock:
+            _lock.acquire()
+        try:
+            ops = self._ops
+            if ops is None:                                   # one zero byte
+                ops = [[self._crcfun(1 << j, b'\x00', 1, self._tab) for j in range(self._regbits)]]
+            while len(ops) <= i:                              # by squaring, into a new list: others may read the old one
+                ops = ops + [_gf2_square(ops[-1])]
+            self._ops = ops
+        finally:
+            if _lock:
+                _lock.release()
+        return ops
+
+    def release(self):                                        # give back the shared table, the calculator is unusable then
+        if _lock:
+            _lock.acquire()
+        try:
+            if self._tabkey and not self._lazy:
+                _release_table(self._tabkey)
+            self._tabkey = self._tab = None
+            self._lazy = False
+        finally:
+            if _lock:
+                _lock.release()
 
 #     def selftest_ok(self):  # works only if we have the 'check' parameter, which we have with the predefined CRC methods
 #         self.reset()
@@ -251,4 +1139,35 @@ class Calculator:
 #             raise ValueError('crc.Calculator: selftest needs a check value')
 #         return self.check == self.checksum(b'\x31\x32\x33\x34\x35\x36\x37\x38\x39')
 
+class CrcState:
+    """
+    Running crc of one stream (hashlib style), made by Calculator.new()
+    """
+    # Many of them share the calculator, with its table. A state is just the calculator and the register.
+    #
+    __slots__ = ('calculator', '_reg')
+
+    def __init__(self, calculator, reg):
+        self.calculator = calculator
+        self._reg = reg
+
+    def update(self, data, start=0, end=None):                # digests data[start:end]
+        self._reg = self.calculator._update(self._reg, data, start, end)
+
+    def copy(self):                                           # an independent state with the same crc so far
+        return CrcState(self.calculator, self._reg)
+
+    def reset(self):
+        self._reg = self.calculator._reg0
+
+    @property
+    def crc(self):                                            # crc of the data so far
+        return self.calculator._value(self._reg)
+
+    def digest(self):                                         # crc as bytes, big endian (like crcmod)
+        return self.crc.to_bytes((self.calculator.width + 7) // 8, 'big')
+
+    def hexdigest(self):
+        return ('%%0%dx' % ((self.calculator.width + 7) // 8 * 2)) % self.crc
+
 
@@ -0,0 +1,108 @@
+# Crc of asyncio streams (micropython asyncio / uasyncio and CPython), computed while the data passes through.
+#
+# The wrappers digest the data in chunks of at most chunk bytes and yield to the event loop between them,
+# so long checksums do not stall other tasks.
+#
+#     reader, writer = await asyncio.open_connection(host, port)
+#     rx = CrcStreamReader(reader, Calculator(Crc16.modbus))
+#     payload = await rx.read_frame(prefix=2)          # length prefix, payload, crc trailer; ValueError if bad
+#
+#     tx = CrcStreamWriter(writer, Calculator(Crc16.modbus))
+#     await tx.awrite(len(payload).to_bytes(2, 'big'))
+#     await tx.awrite(payload)
+#     await tx.write_trailer()                          # appends the crc and starts the next one
+#
+# The crc trailer is sent little endian for crcs with refout (like modbus and crc32), big endian otherwise,
+# unless byteorder is given.
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+def _byteorder(calculator, byteorder):
+    return byteorder or ('little' if calculator.refout else 'big')
+
+class CrcStreamReader:
+    def __init__(self, stream, calculator, chunk=256):
+        self.stream = stream
+        self.calculator = calculator
+        self.chunk = chunk
+
+    @property
+    def crc(self):                                  # crc of the data read since the last reset
+        return self.calculator.peek()
+
+    def reset(self):
+        self.calculator.reset()
+
+    async def _digest(self, data):
+        n = len(data)
+        c = self.chunk
+        for i in range(0, n, c):
+            if i:
+                await asyncio.sleep(0)              # let the other tasks run
+            self.calculator.digest(data, i, min(i + c, n))
+        return data
+
+    async def read(self, n=-1):
+        return await self._digest(await self.stream.read(n))
+
+    async def readexactly(self, n):
+        return await self._digest(await self.stream.readexactly(n))
+
+    async def readline(self):
+        return await self._digest(await self.stream.readline())
+
+    async def verify_trailer(self, nbytes=None, byteorder=None):
+        # reads the crc that follows the data (not digested), compares it with the running crc and resets it
+        nbytes = nbytes or (self.calculator.width + 7) // 8
+        trailer = await self.stream.readexactly(nbytes)
+        return int.from_bytes(trailer, _byteorder(self.calculator, byteorder)) == self.calculator.checksum()
+
+    async def read_frame(self, prefix=2, byteorder='big', covered=True, crc_byteorder=None):
+        # reads a frame: length (prefix bytes), payload, crc trailer, returns the payload.
+        # covered: the crc includes the length prefix. Raises ValueError if the crc does not match.
+        self.calculator.reset()
+        head = await self.stream.readexactly(prefix)
+        if covered:
+            await self._digest(head)
+        payload = await self.readexactly(int.from_bytes(head, byteorder))
+        if not await self.verify_trailer(None, crc_byteorder):
+            raise ValueError('crc.aio: crc mismatch')
+        return payload
+
+class CrcStreamWriter:
+    def __init__(self, stream, calculator, chunk=256):
+        self.stream = stream
+        self.calculator = calculator
+        self.chunk = chunk
+
+    @property
+    def crc(self):                                  # crc of the data written since the last reset
+        return self.calculator.peek()
+
+    def reset(self):
+        self.calculator.reset()
+
+    def write(self, data):                          # as stream.write(), digests data in one go
+        self.calculator.digest(data)
+        self.stream.write(data)
+
+    async def drain(self):
+        await self.stream.drain()
+
+    async def awrite(self, data):                   # writes and digests data in chunks, draining after each
+        n = len(data)
+        c = self.chunk
+        mv = memoryview(data)
+        for i in range(0, n, c):
+            self.calculator.digest(data, i, min(i + c, n))
+            self.stream.write(mv[i:i + c])
+            await self.stream.drain()
+
+    async def write_trailer(self, nbytes=None, byteorder=None):
+        # appends the crc of the data written since the last reset, and resets it
+        nbytes = nbytes or (self.calculator.width + 7) // 8
+        self.stream.write(self.calculator.checksum().to_bytes(nbytes, _byteorder(self.calculator, byteorder)))
+        await self.stream.drain()
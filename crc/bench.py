@@ -7,33 +7,23 @@ gc.collect(); free= gc.mem_free(); print('Free:', free, 'bytes.')
 
 data = bytearray((i%256 for i in range(10_000)))
 
+def bench(name, calculator):
+    if calculator._lazy:                        # the table is computed on first use
+        calculator._table()
+    tabsize = len(bytes(calculator._tab)) if calculator._tab else 0
+    for i in range(3):
+        t0 = ticks_us()
+        calculator.digest(data)
+        crc = calculator.checksum()
+        t1 = ticks_us()
+        td = ticks_diff(t1,t0)
+        print(f'{name}: 0x{crc:x}, {td/len(data):6.2f}µs per byte, {len(data)/td:6.2f} bytes per µs, table {tabsize} bytes')
+
 crc8 = Calculator(Crc8.maxim_dow)
 print('Crc implementation:', crc8.implementation)
-for i in range(3):
-    t0 = ticks_us()
-    crc8.digest(data)
-    crc = crc8.checksum()
-    t1 = ticks_us()
-    td = ticks_diff(t1,t0)
-    print(f'crc8: 0x{crc:02x}, {td/len(data):6.2f}µs per byte')
-
-crc16 = Calculator(Crc16.ccitt)
-for i in range(3):
-    t0 = ticks_us()
-    crc16.digest(data)
-    crc = crc16.checksum()
-    t1 = ticks_us()
-    td = ticks_diff(t1,t0)
-    print(f'crc16: 0x{crc:04x}, {td/len(data):6.2f}µs per byte')
-
-crc32 = Calculator(Crc32.crc32)
-for i in range(3):
-    t0 = ticks_us()
-    crc32.digest(data)
-    crc = crc32.checksum()
-    t1 = ticks_us()
-    td = ticks_diff(t1,t0)
-    print(f'crc32: 0x{crc:08x}, {td/len(data):6.2f}µs per byte')
+bench('crc8', crc8)
+bench('crc16', Calculator(Crc16.ccitt))
+bench('crc32', Calculator(Crc32.crc32))
 
 # builtin crc32 from binascii
 import binascii
@@ -44,14 +34,15 @@ for i in range(3):
     td = ticks_diff(t1,t0)
     print(f'binascii.crc32: 0x{crc:08x}, {td/len(data):6.2f}µs per byte')
 
-crc64 = Calculator(Crc64.crc64)
-for i in range(3):
-    t0 = ticks_us()
-    crc64.digest(data)
-    crc = crc64.checksum()
-    t1 = ticks_us()
-    td = ticks_diff(t1,t0)
-    print(f'crc64: 0x{crc:08x}, {td/len(data):6.2f}µs per byte')
+bench('crc32 binascii', Calculator(Crc32.crc32, backend='binascii'))   # the same, through the Calculator
+
+bench('crc64', Calculator(Crc64.crc64))
+
+# low memory versions
+for table in ('nibble', None):
+    bench(f'crc16 table={table}', Calculator(Crc16.ccitt, table=table))
+    bench(f'crc32 table={table}', Calculator(Crc32.crc32, table=table))
+    bench(f'crc64 table={table}', Calculator(Crc64.crc64, table=table))
 
 
 # Blackpill STM32F411 @ 96MHz
@@ -0,0 +1,193 @@
+# Benchmark suite of the crc calculations, for micropython (unix port or boards) and CPython.
+#
+# For every working backend and every crc of the catalog it times digest() over buffer sizes from 1 byte to 1 MB,
+# at an aligned and an unaligned start offset, and fits time = overhead + size * per_byte, which separates the
+# per-call overhead from the per-byte cost. Also reported are the construction time of a calculator (with its
+# table not yet cached) and the memory it takes (gc.mem_free() delta on micropython, tracemalloc on CPython).
+#
+#     micropython -m crc.benchsuite [-q] [-o results.json] [-b baseline.json] [-t 10] [-c Crc16] [-k viper]
+#
+# -q  quick: sizes up to 4 kB only      -o  write the results as JSON      -b  compare with stored results
+# -t  tolerance in percent (default 10) -c  only crcs whose name or alias contains this (or is this)   -k  only this backend
+#
+# With -b the per-byte and per-call times are compared with the baseline, regressions beyond the tolerance are
+# printed, and the exit status is 1 if there are any.
+
+import gc
+import sys
+import json
+import crc
+from crc import Calculator, Crc8, Crc16, Crc32, Crc64
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:                              # CPython
+    from time import perf_counter_ns
+    def ticks_us():
+        return perf_counter_ns() // 1000
+    def ticks_diff(a, b):
+        return a - b
+
+try:
+    import tracemalloc                           # CPython
+except ImportError:
+    tracemalloc = None
+
+sizes = (1, 16, 256, 4096, 65536, 1 << 20)
+quick_sizes = (1, 16, 256, 4096)
+offsets = (0, 1)                                 # aligned and unaligned start of the data
+
+def catalog():                                   # [(name, definition)] of all catalog crcs
+    crcs = []
+    for group in (Crc8, Crc16, Crc32, Crc64):
+        for name in group.names():
+            crcs.append((group.__name__ + '.' + name, getattr(group, name)))
+    return crcs
+
+def select(pattern):                             # [(name, definition)] of the crcs with a name or alias containing pattern
+    found, exact = set(), set()                  # a crc named exactly so is taken alone
+    for group in (Crc8, Crc16, Crc32, Crc64):
+        for name in group.names(True):
+            full = group.__name__ + '.' + name
+            if pattern in full:
+                found.add((group.__name__, getattr(group, name)))
+                if pattern in (name, full):
+                    exact.add((group.__name__, getattr(group, name)))
+    found = exact or found
+    return [(n, d) for n, d in catalog() if (n.split('.')[0], d) in found]
+
+def _mem_start():
+    gc.collect()
+    if tracemalloc:
+        tracemalloc.start()
+        return 0
+    return gc.mem_free()
+
+def _mem_used(start):
+    if tracemalloc:
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return used
+    gc.collect()
+    return start - gc.mem_free()
+
+def construct(definition, backend):              # (construction time µs, memory bytes, table bytes)
+    crc.table_cache_clear()
+    m = _mem_start()
+    t0 = ticks_us()
+    c = Calculator(definition, backend=backend)
+    c.digest(b'\x00')                            # and its first use
+    t = ticks_diff(ticks_us(), t0)
+    mem = _mem_used(m)
+    tabsize = len(bytes(c._tab)) if c._tab else 0
+    c.release()
+    return t, mem, tabsize
+
+def time_digest(c, buf, offset, size):           # µs per digest() of size bytes, best of 3
+    n = max(1, 4096 // size)                     # repeat short ones
+    best = None
+    for _ in range(3):
+        t0 = ticks_us()
+        for _ in range(n):
+            c.digest(buf, offset, offset + size)
+        t = ticks_diff(ticks_us(), t0) / n
+        if best is None or t < best:
+            best = t
+    return best
+
+def fit(points):                                 # t = a + b * size through the smallest and largest size -> (a, b)
+    points = sorted(points)
+    (x0, y0), (x1, y1) = points[0], points[-1]
+    b = (y1 - y0) / (x1 - x0) if x1 > x0 else 0.0
+    return y0 - b * x0, b
+
+def run(backends=None, crcs=None, sizes=sizes, offsets=offsets, log=print):
+    if not backends:
+        backends = crc.available_backends()
+        if crc._binascii_crc32:
+            backends.append('binascii')         # for the crcs it applies to
+    if crcs is None:
+        crcs = catalog()
+    buf = None
+    for size in sorted(sizes, reverse=True):     # the largest buffer this machine can provide
+        try:
+            buf = bytearray(size + max(offsets))
+            break
+        except MemoryError:
+            pass
+    maxsize = len(buf) - max(offsets)
+    results = []
+    for backend in backends:
+        for name, d in crcs:
+            try:
+                ct, mem, tabsize = construct(d, backend)
+                c = Calculator(d, backend=backend)
+            except Exception as e:               # e.g. backend not usable for this width
+                log('%s %s: %r' % (backend, name, e))
+                continue
+            if c.implementation != backend:      # binascii fell back to the table computation
+                c.release()
+                continue
+            for offset in offsets:
+                times = {}
+                for size in sizes:
+                    if size <= maxsize:
+                        times[str(size)] = time_digest(c, buf, offset, size)
+                overhead, per_byte = fit([(int(s), t) for s, t in times.items()])
+                r = {'backend': backend, 'implementation': c.implementation, 'crc': name, 'offset': offset,
+                     'overhead_us': round(overhead, 3), 'per_byte_ns': round(per_byte * 1000, 3),
+                     'construct_us': ct, 'mem_bytes': mem, 'table_bytes': tabsize, 'times_us': times}
+                log('%-10s %-9s %-20s off %d: %9.3f µs per call %9.3f ns per byte, construct %7d µs, %6d bytes' % (
+                    backend, c.implementation, name, offset, overhead, per_byte * 1000, ct, mem))
+                results.append(r)
+            c.release()
+    return {'implementation': sys.implementation.name, 'platform': sys.platform,
+            'version': sys.version, 'results': results}
+
+def compare(results, baseline, tolerance=10, log=print):   # list of regressions against the baseline
+    old = {}
+    for r in baseline['results']:
+        old[(r['backend'], r['crc'], r['offset'])] = r
+    regressions = []
+    f = 1 + tolerance / 100
+    for r in results['results']:
+        b = old.get((r['backend'], r['crc'], r['offset']))
+        if b is None:
+            continue
+        for key, slack in (('per_byte_ns', 0.5), ('overhead_us', 1.0)):   # slack: below timer resolution
+            if r[key] > b[key] * f + slack:
+                regressions.append((r['backend'], r['crc'], r['offset'], key, b[key], r[key]))
+                log('regression %s %s off %d %s: %.3f -> %.3f' % regressions[-1])
+    return regressions
+
+def main(argv):
+    opts = {}
+    i = 0
+    while i < len(argv):
+        a = argv[i]
+        if a == '-q':
+            opts[a] = True
+        elif a in ('-o', '-b', '-t', '-c', '-k'):
+            i += 1
+            opts[a] = argv[i]
+        else:
+            raise SystemExit('usage: benchsuite [-q] [-o results.json] [-b baseline.json] [-t 10] [-c Crc16] [-k viper]')
+        i += 1
+    crcs = None
+    if '-c' in opts:
+        crcs = select(opts['-c'])
+        if not crcs:
+            raise SystemExit('benchsuite: no crc name or alias contains ' + repr(opts['-c']))
+    backends = [opts['-k']] if '-k' in opts else None
+    results = run(backends, crcs, quick_sizes if '-q' in opts else sizes)
+    if '-o' in opts:
+        with open(opts['-o'], 'w') as f:
+            json.dump(results, f)
+    if '-b' in opts:
+        with open(opts['-b']) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, float(opts.get('-t', 10))):
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
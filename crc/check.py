@@ -2,7 +2,11 @@
 
 
 
-from crc import Calculator, Crc8, Crc16, Crc32, Crc64, Opt_asm_thumb
+from crc import Calculator, Crc8, Crc16, Crc32, Crc64, available_backends
+try:
+    from crc import Opt_asm_thumb           # ARM boards, elsewhere the checks run with the other backends
+except Exception:
+    pass
 
 data = bytes('123456789', 'utf-8')
 data1 = bytes('123', 'utf-8')
@@ -10,13 +14,150 @@ data2 = bytes('456789', 'utf-8')
 
 for crcgrp in (Crc8, Crc16, Crc32, Crc64):
     grpname = getattr(crcgrp, '__name__')
-    for alg in dir(crcgrp):
-        if not alg.startswith('__'):
-            crcfun = Calculator(getattr(crcgrp, alg))
-            crcfun.digest(data1)
-            crc = crcfun.checksum(data2)
-            chk_ok = crc == crcfun.check
-            # print(f'Algorithm: {grpname+'.'+alg:15s} CRC("123456789") = 0x{crc:x}.   Check: {'O.K.' if chk_ok else 'Wrong'}')
-            print('Algorithm: ', grpname+'.'+alg,' CRC("123456789") = 0x',crc,'.   Check: ','O.K.' if chk_ok else 'Wrong')
-        
-        
+    for alg in crcgrp.names():
+        crcfun = Calculator(getattr(crcgrp, alg))
+        crcfun.digest(data1)
+        crc = crcfun.checksum(data2)
+        chk_ok = crc == crcfun.check
+        # print(f'Algorithm: {grpname+'.'+alg:15s} CRC("123456789") = 0x{crc:x}.   Check: {'O.K.' if chk_ok else 'Wrong'}')
+        print('Algorithm: ', grpname+'.'+alg,' CRC("123456789") = 0x',crc,'.   Check: ','O.K.' if chk_ok else 'Wrong')
+
+
+# --- slices, nibble and bitwise modes, combine() and verify(), with each backend working on this platform ---
+#
+# All catalog crcs, and crcs of each width 1 .. 64 with all four reflection settings, are compared with a bit by bit
+# computation that does not use the Calculator code.
+
+variants = ({}, {'slices': 4}, {'slices': 8}, {'table': 'nibble'}, {'table': None})
+frame = bytes(range(7, 250, 3))             # 81 bytes, taken apart for combine()
+
+def reflect(v, n):
+    r = 0
+    for i in range(n):
+        r = r << 1 | v & 1
+        v >>= 1
+    return r
+
+def reference(width, poly, init, refin, refout, xorout, data):
+    mask = (1 << width) - 1
+    crc = init
+    for b in data:
+        if refin:
+            b = reflect(b, 8)
+        for i in range(7, -1, -1):
+            top = crc >> (width - 1) ^ b >> i & 1
+            crc = crc << 1 & mask
+            if top:
+                crc ^= poly
+    if refout:
+        crc = reflect(crc, width)
+    return crc ^ xorout
+
+def check(d, backend, kw):                  # what went wrong with the crc definition d
+    c = Calculator(d, backend=backend, **kw)
+    wrong = []
+    crc = c.checksum(frame)
+    if crc != reference(*(d[:6] + (frame,))):
+        wrong.append('checksum')
+    if c.combine(c.checksum(frame[:29]), c.checksum(frame[29:]), len(frame) - 29) != crc:
+        wrong.append('combine')
+    framed = bytearray(frame) + crc.to_bytes((d[0] + 7) // 8, 'little' if d[4] else 'big')
+    if not c.verify(framed):
+        wrong.append('verify')
+    framed[5] ^= 1
+    if c.verify(framed):
+        wrong.append('verify of a changed frame')
+    c.release()
+    return wrong
+
+catalog = []
+for crcgrp in (Crc8, Crc16, Crc32, Crc64):
+    for alg in crcgrp.names():
+        catalog.append((crcgrp.__name__ + '.' + alg, getattr(crcgrp, alg)))
+crcs = list(catalog)
+for width in range(1, 65):
+    mask = (1 << width) - 1
+    for refin, refout in ((False, False), (True, True), (False, True), (True, False)):
+        d = (width, (0x42f0e1eba9ea3693 >> (64 - width)) | 1, 0x0123456789abcdef & mask, refin, refout,
+             0xfedcba9876543210 & mask, None)
+        crcs.append(('width %d refin %d refout %d' % (width, refin, refout), d))
+
+for backend in available_backends():
+    nwrong = 0
+    for name, d in crcs:
+        for kw in variants:
+            wrong = check(d, backend, kw)
+            if wrong:
+                nwrong += 1
+                print('Backend: ', backend, ' Algorithm: ', name, kw, '  Wrong: ', ', '.join(wrong))
+    print('Backend: ', backend, ' ', len(crcs) * len(variants), 'calculators checked.   Check: ',
+          'O.K.' if not nwrong else 'Wrong')
+
+
+# --- threads (unix port, ESP32 and RP2040 boards, CPython): one calculator shared by several of them ---
+#
+# The threads take the lazily computed table and build the operators of combine() at the same time, the table
+# must be taken once only. Then checksum_split() is compared with checksum().
+
+from crc import _tables, _tabkey
+from time import sleep
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
+def users(d):                               # number of calculators holding the shared slices=8 table of d, the table
+    entry = _tables.get(_tabkey(d, slices=8))
+    return (entry[1], entry[0]) if entry else (0, None)
+
+def worker(c, results, i, done, go):
+    try:
+        go.acquire()                        # all threads start together
+        go.release()
+        results[i] = (c.update(None, frame),
+                      c.combine(c.update(None, frame[:29]), c.update(None, frame[29:]), len(frame) - 29))
+    finally:
+        done.release()
+
+if _thread:
+    nwrong = 0
+    for name, d in catalog:
+        nusers = users(d)[0]
+        c = Calculator(d, slices=8)         # its table is hardly in the cache, so it is computed by the threads
+        ref = reference(*(d[:6] + (frame,)))
+        results = [None] * 4
+        locks = []
+        go = _thread.allocate_lock()
+        go.acquire()
+        for i in range(1, 4):
+            lock = _thread.allocate_lock()
+            lock.acquire()                  # released by the worker when done
+            try:
+                _thread.start_new_thread(worker, (c, results, i, lock, go))
+            except OSError:                 # e.g. RP2040: only one more thread
+                break
+            locks.append(lock)
+        lock = _thread.allocate_lock()
+        lock.acquire()
+        sleep(0.01)                         # until the workers wait for go
+        go.release()
+        worker(c, results, 0, lock, go)     # this thread as well
+        for lock in locks:
+            lock.acquire()
+        wrong = ['thread %d' % i for i in range(len(locks) + 1) if results[i] != (ref, ref)]
+        n, tab = users(d)
+        if c._tab is not None and (n != nusers + 1 or tab is not c._tab):
+            wrong.append('table taken more than once')
+        for n in (0, 1, 2, 3, 80, 81):
+            if c.checksum_split(frame[:n]) != c.checksum(frame[:n]):
+                wrong.append('checksum_split of %d bytes' % n)
+        c.digest(frame[:10])                # data digested before
+        if c.checksum_split(frame[10:]) != ref:
+            wrong.append('checksum_split after digest')
+        c.release()
+        if users(d)[0] != nusers:
+            wrong.append('table not given back by release()')
+        if wrong:
+            nwrong += 1
+            print('Threads:  Algorithm: ', name, '  Wrong: ', wrong)
+    print('Threads: ', len(catalog), 'shared calculators checked.   Check: ', 'O.K.' if not nwrong else 'Wrong')
@@ -0,0 +1,63 @@
+# Generator of precomputed crc lookup table modules.
+#
+# Runs on the host (CPython, or the micropython unix port) and writes a python module containing the
+# lookup table as a bytes literal and the complete crc parameters. Frozen into the firmware or compiled
+# to .mpy the table stays in flash and the Calculator uses it without copying or computing it:
+#
+#     import crc16_modbus
+#     calculator = Calculator(crc16_modbus.params, slices=crc16_modbus.slices, tab=crc16_modbus.tab)
+#
+# Usage from the command line:
+#
+#     python -m crc.gentab Crc16.modbus [slices [outfile]]      # or a catalog name like CRC-16/MODBUS
+#
+# or from python with a crc definition tuple or config dict:
+#
+#     from crc import gentab, Crc16
+#     gentab.write('crc16_modbus.py', Crc16.modbus)
+
+import crc
+from crc import Calculator, _mktab
+
+_tc_size = {'B': 1, 'H': 2, 'I': 4, 'Q': 8}
+
+def params(definition):          # complete parameter tuple (width, poly, init, refin, refout, xorout, check)
+    c = Calculator(definition)
+    check = c.check
+    if check is None:            # compute the check value, if the definition lacks it
+        check = c.checksum(b'123456789')
+    c.release()
+    return (c.width, c.poly, c.init, c.refin, c.refout, c.xorout, check)
+
+def table(definition, slices=1):  # lookup table as little endian bytes, the byte order of the targets
+    width, poly, _, refin = params(definition)[:4]
+    tab = _mktab(width, poly, refin, slices)
+    size = _tc_size[crc._tabtypes[crc._storage(width)][0]]
+    return b''.join(v.to_bytes(size, 'little') for v in tab)
+
+def source(definition, slices=1, name=None):
+    p = params(definition)
+    digits = (p[0] + 3) // 4
+    lines = ['# Generated by crc/gentab.py%s, do not edit.' % (' from ' + name if name else ''),
+             '# (Width, Poly, Init, RefIn, RefOut, Xorout, Check)',
+             'params = (%d, 0x%0*x, 0x%0*x, %s, %s, 0x%0*x, 0x%0*x)' % (p[0], digits, p[1], digits, p[2],
+                 p[3], p[4], digits, p[5], digits, p[6]),
+             'slices = %d' % slices,
+             'tab = (']
+    t = table(definition, slices)
+    for i in range(0, len(t), 16):
+        lines.append("    b'" + ''.join('\\x%02x' % b for b in t[i:i+16]) + "'")
+    lines.append(')')
+    return '\n'.join(lines) + '\n'
+
+def write(filename, definition, slices=1, name=None):
+    with open(filename, 'w') as f:
+        f.write(source(definition, slices, name))
+
+if __name__ == '__main__':
+    import sys
+    name = sys.argv[1]
+    slices = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    filename = sys.argv[3] if len(sys.argv) > 3 else name.replace('.', '_').replace('/', '_').replace('-', '_').lower() + '.py'
+    write(filename, crc.lookup(name), slices, name)
+    print('Wrote', filename)
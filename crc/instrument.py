@@ -0,0 +1,223 @@
+# Optional instrumentation of the crc calculators: bytes digested, calls and time, per calculator.
+#
+# Nothing of it is active until enable() is called: it then replaces the Calculator methods by counting and
+# timing versions, disable() puts the original ones back. So it may stay on deployed boards at no cost.
+#
+#     from crc import instrument
+#     instrument.enable()
+#     calculator = Calculator(Crc16.modbus)
+#     instrument.label(calculator, 'modbus uart1')        # optional name, default: crc parameters and backend
+#     ...
+#     for s in instrument.snapshot():                     # the hottest first
+#         print(s)
+#     instrument.reset()                                  # zero the counters
+#
+# The times are µs, from ticks_us() on micropython and perf_counter_ns() on CPython. The kernel time is the
+# time spent in digest() (and update(), CrcState.update(), verify(), update_patch(), the batch methods), the table
+# time the time spent computing lookup tables.
+#
+# The counters are kept by the calculator. snapshot() lists at most registry_max of them: when more calculators
+# are busy, the one with the least kernel time is dropped from the list (until it digests again), and release()
+# removes a calculator. So calculators made per connection or frame do not pile up.
+
+import crc
+from crc import Calculator
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:                              # CPython
+    from time import perf_counter_ns
+    def ticks_us():
+        return perf_counter_ns() / 1000
+    def ticks_diff(a, b):
+        return a - b
+
+# stats of a calculator: [label, bytes, digest calls, checksum calls, kernel µs, table µs, listed in _registry]
+registry_max = 32
+_registry = []
+_saved = None       # the original methods, while enabled
+_methods = ('__init__', 'digest', 'checksum', 'checksum_many', 'checksum_packed', '_update', 'verify', 'update_patch',
+            'digest_iov', 'digest_into', 'checksum_into', 'checksum_split', 'release')
+_building = None    # stats of the calculator computing a table
+_batch = False      # within a counted method, its digest() and _update() calls are not counted again
+
+def _stats(calc):
+    try:
+        st = calc._stats
+    except AttributeError:
+        st = calc._stats = ['crc%d poly 0x%x init 0x%x %s' % (calc.width, calc.poly, calc.init, calc.implementation),
+                            0, 0, 0, 0, 0, False]
+    if not st[6]:
+        _list(st)
+    return st
+
+def _list(st):
+    if len(_registry) >= registry_max:              # drop the coldest one
+        cold = min(_registry, key=lambda s: s[4])
+        cold[6] = False
+        _registry.remove(cold)
+    st[6] = True
+    _registry.append(st)
+
+def _unlist(st):
+    if st[6]:
+        st[6] = False
+        _registry.remove(st)
+
+def stats(calc):     # the counters of one calculator, as dict (see snapshot())
+    return _asdict(_stats(calc))
+
+def label(calc, name):
+    _stats(calc)[0] = name
+
+def enable():
+    global _saved
+    if _saved:
+        return
+    C = Calculator
+    _saved = {name: getattr(C, name) for name in _methods}
+    _saved['_mktab'] = mktab = crc._mktab
+    init, digest, checksum, update, release = (_saved[name] for name in ('__init__', 'digest', 'checksum', '_update',
+                                                                         'release'))
+
+    def __init__(self, *args, **kwargs):
+        global _building
+        prev = _building
+        st = _building = [None, 0, 0, 0, 0, 0]   # the table is computed before the label can be made
+        try:
+            init(self, *args, **kwargs)
+        finally:
+            _building = prev
+        _stats(self)[5] += st[5]
+
+    def _timed(fun, st, *args):                  # kernel time, and the table time if the table is computed now
+        global _building
+        prev = _building
+        _building = st
+        t0 = ticks_us()
+        try:
+            return fun(*args)
+        finally:
+            st[4] += ticks_diff(ticks_us(), t0)
+            _building = prev
+
+    def _digest(self, data, start=0, end=None):
+        if _batch:
+            return digest(self, data, start, end)
+        st = _stats(self)
+        st[1] += (len(data) if end is None else end) - start
+        st[2] += 1
+        _batched(digest, self, data, start, end)     # without the _update() it may call
+
+    def _update(self, crc, data, start=0, end=None):     # update(), CrcState.update() and RollingCrc go through it
+        if _batch:
+            return update(self, crc, data, start, end)
+        st = _stats(self)
+        st[1] += (len(data) if end is None else end) - start
+        st[2] += 1
+        return _timed(update, st, self, crc, data, start, end)
+
+    def _checksum(self, data=None):
+        if not _batch:
+            _stats(self)[3] += 1
+        return checksum(self, data)
+
+    def _batched(fun, self, *args):              # digest(), _update() and checksum() calls within are not counted again
+        global _batch
+        prev = _batch
+        _batch = True
+        try:
+            return _timed(fun, _stats(self), self, *args)
+        finally:
+            _batch = prev
+
+    def _verify(self, frame, byteorder=None):
+        st = _stats(self)
+        st[1] += len(frame)
+        st[3] += 1
+        return _batched(_saved['verify'], self, frame, byteorder)
+
+    def _update_patch(self, old_crc, total_len, offset, old_bytes, new_bytes):
+        st = _stats(self)
+        st[1] += len(new_bytes)
+        st[2] += 1
+        return _batched(_saved['update_patch'], self, old_crc, total_len, offset, old_bytes, new_bytes)
+
+    def _checksum_many(self, buffers):
+        st = _stats(self)
+        crcs = _batched(_saved['checksum_many'], self, buffers)
+        st[1] += sum(len(b) for b in buffers)
+        st[3] += len(crcs)
+        return crcs
+
+    def _checksum_packed(self, buf, offsets, lengths, out):
+        st = _stats(self)
+        _batched(_saved['checksum_packed'], self, buf, offsets, lengths, out)
+        st[1] += sum(lengths)
+        st[3] += len(offsets)
+        return out
+
+    def _digest_iov(self, buffers):
+        st = _stats(self)
+        _batched(_saved['digest_iov'], self, buffers)
+        st[1] += sum(len(b) for b in buffers)
+        st[2] += 1
+
+    def _digest_into(self, dst, src, n=None):
+        st = _stats(self)
+        _batched(_saved['digest_into'], self, dst, src, n)
+        st[1] += len(src) if n is None else n
+        st[2] += 1
+
+    def _checksum_into(self, buf, byteorder=None):
+        _stats(self)[3] += 1
+        return _batched(_saved['checksum_into'], self, buf, byteorder)
+
+    def _checksum_split(self, buffer, threads=2):
+        st = _stats(self)
+        crc = _batched(_saved['checksum_split'], self, buffer, threads)
+        st[1] += len(buffer)
+        st[3] += 1
+        return crc
+
+    def _release(self):
+        st = getattr(self, '_stats', None)       # not _stats(self), that would list it again
+        if st:
+            _unlist(st)
+        release(self)
+
+    def _mktab(*args):
+        t0 = ticks_us()
+        tab = mktab(*args)
+        if _building:
+            _building[5] += ticks_diff(ticks_us(), t0)
+        return tab
+
+    for name, fun in (('__init__', __init__), ('digest', _digest), ('checksum', _checksum), ('_update', _update),
+                      ('verify', _verify), ('update_patch', _update_patch),
+                      ('checksum_many', _checksum_many), ('checksum_packed', _checksum_packed),
+                      ('digest_iov', _digest_iov), ('digest_into', _digest_into), ('checksum_into', _checksum_into),
+                      ('checksum_split', _checksum_split), ('release', _release)):
+        setattr(C, name, fun)
+    crc._mktab = _mktab
+
+def disable():
+    global _saved
+    if _saved:
+        for name in _methods:
+            setattr(Calculator, name, _saved[name])
+        crc._mktab = _saved['_mktab']
+        _saved = None
+
+def _asdict(st):
+    return {'label': st[0], 'bytes': st[1], 'digests': st[2], 'checksums': st[3], 'kernel_us': st[4],
+            'table_us': st[5]}
+
+def snapshot():      # list of dicts of the counters, the calculators with the most kernel time first
+    s = [_asdict(st) for st in _registry]
+    s.sort(key=lambda d: -d['kernel_us'])
+    return s
+
+def reset():         # zero the counters
+    for st in _registry:
+        st[1:6] = [0, 0, 0, 0, 0]
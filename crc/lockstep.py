@@ -0,0 +1,38 @@
+# Crcs of many equal-length records at once with NumPy, for CPython.
+#
+# The records are the rows of an (N, L) uint8 array. The registers of all N records are advanced in lockstep,
+# column by column, with the same table lookup as the byte-by-byte kernel, so each of the L steps is one
+# vectorized operation on N registers. The results are bit-identical to Calculator.checksum() of each row.
+#
+#     import numpy as np
+#     from crc import Calculator, Crc32
+#     from crc.lockstep import checksum_records
+#     frames = np.frombuffer(telemetry, dtype=np.uint8).reshape(-1, 64)
+#     crcs = checksum_records(Calculator(Crc32.crc32), frames)      # array of len(frames) crcs
+
+import numpy as np
+from crc import Calculator, _storage
+
+_dtypes = {8: np.uint8, 16: np.uint16, 32: np.uint32, 64: np.uint64}
+
+def checksum_records(calculator, records):
+    # crcs of the rows of records, an (N, L) array of bytes; calculator supplies the parameters only
+    records = np.asarray(records, dtype=np.uint8)
+    if records.ndim != 2:
+        raise ValueError('crc.lockstep: records must be an (N, L) array')
+    c = calculator
+    c = Calculator((c.width, c.poly, c.init, c.refin, c.refout, c.xorout, c.check), backend='bytecode')
+    nb = _storage(c.width)
+    tab = np.array(c._table()[:256], dtype=np.uint64)          # T0, the byte table (shared)
+    reg = np.full(records.shape[0], c._reg0, dtype=np.uint64)
+    for col in np.ascontiguousarray(records.T):                # registers of all records, one byte each
+        reg = (reg >> np.uint64(8)) ^ tab[(reg & np.uint64(0xff)) ^ col]
+    reg = reg.astype(_dtypes[nb])
+    if c.refin != c.refout:                                    # rare, Calculator._outreg() of each
+        reg = np.array([c._outreg(int(r)) for r in reg], dtype=_dtypes[nb])
+    elif not c.refout:                                         # vectorized Calculator._fromreg()
+        if nb > 8:
+            reg = reg.byteswap()
+        reg >>= _dtypes[nb](nb - c.width)
+    c.release()
+    return reg ^ _dtypes[nb](c.xorout)
@@ -0,0 +1,79 @@
+# Parallel crc computation of large files and buffers, for CPython.
+#
+# The input is split into chunks, the chunk crcs are computed in a process (or thread) pool and then
+# stitched together with Calculator.combine(). Files are memory mapped by each worker, so they are
+# never read into a bytes object.
+#
+#     from crc import Calculator, Crc32
+#     from crc.parallel import checksum_file
+#     print(hex(checksum_file(Calculator(Crc32.crc32), 'image.bin', workers=8)))
+
+import os
+import mmap
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from crc import Calculator
+
+min_chunk = 1 << 16      # smaller chunks are not worth the overhead
+
+def _params(calculator):
+    c = calculator
+    return (c.width, c.poly, c.init, c.refin, c.refout, c.xorout, c.check)
+
+def _buffer_crc(params, slices, data):
+    calc = Calculator(params, slices=slices)
+    calc.digest(data)
+    return calc.checksum()
+
+def _file_crc(params, slices, path, offset, length):
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            with memoryview(m) as mv:
+                return _buffer_crc(params, slices, mv[offset:offset + length])
+
+def _chunks(size, workers, chunk_size):
+    if chunk_size is None:
+        chunk_size = max(min_chunk, -(-size // workers))
+    return [(off, min(chunk_size, size - off)) for off in range(0, size, chunk_size)]
+
+def _combine(calculator, crcs, chunks):
+    crc = crcs[0]
+    for c, (_, n) in zip(crcs[1:], chunks[1:]):
+        crc = calculator.combine(crc, c, n)
+    return crc
+
+def checksum_file(calculator, path, workers=None, chunk_size=None):
+    # crc of the file at path, computed by worker processes; calculator supplies the parameters only
+    params = _params(calculator)
+    size = os.path.getsize(path)
+    if size == 0:
+        return Calculator(params).checksum()
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(size, workers, chunk_size)
+    if len(chunks) == 1:
+        return _file_crc(params, calculator.slices, path, 0, size)
+    n = len(chunks)
+    with ProcessPoolExecutor(min(workers, n)) as ex:
+        crcs = list(ex.map(_file_crc, [params] * n, [calculator.slices] * n, [path] * n,
+                           [c[0] for c in chunks], [c[1] for c in chunks]))
+    return _combine(calculator, crcs, chunks)
+
+def checksum_parallel(calculator, buffer, workers=None, chunk_size=None, threads=False):
+    # crc of buffer (any object with the buffer protocol). Worker processes get copies of their chunks,
+    # with threads=True the chunks are shared, which only scales if the crc kernel releases the GIL
+    params = _params(calculator)
+    mv = memoryview(buffer).cast('B')
+    size = len(mv)
+    if size == 0:
+        return Calculator(params).checksum()
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(size, workers, chunk_size)
+    n = len(chunks)
+    if n == 1:
+        return _buffer_crc(params, calculator.slices, mv)
+    if threads:
+        pool, parts = ThreadPoolExecutor, [mv[o:o + l] for o, l in chunks]
+    else:
+        pool, parts = ProcessPoolExecutor, [bytes(mv[o:o + l]) for o, l in chunks]
+    with pool(min(workers, n)) as ex:
+        crcs = list(ex.map(_buffer_crc, [params] * n, [calculator.slices] * n, parts))
+    return _combine(calculator, crcs, chunks)
@@ -0,0 +1,91 @@
+# Rolling crc: the crc of a window of fixed length sliding over data, one byte at a time.
+#
+# Sliding the window by one byte takes the byte table lookup of the incoming byte, as digest() does, and one lookup
+# in a table of the outgoing byte, that removes its contribution (and corrects the one of init) from the register.
+# So scanning data for blocks with known crcs (dedup, rsync-like matching, sync words) takes O(n) instead of O(n * w).
+#
+#     r = RollingCrc(Crc32.crc32, 64)
+#     crc = r.start(buf)                             # crc of buf[0:64]
+#     crc = r.roll(buf[0], buf[64])                  # crc of buf[1:65]
+#     for offset in r.scan(capture, {crc_a, crc_b}): # offsets of the windows of capture with one of these crcs
+#         ...
+#
+# With the viper implementation scan() runs there for crcs up to 32 bits (on ports with 32 bit addresses).
+
+from array import array
+from crc import Calculator, _tabtypes, _backend, _addr32, addressof
+
+class RollingCrc:
+    def __init__(self, params, window, backend=None):     # params: crc definition tuple or dict, as for Calculator
+        if window < 1:
+            raise ValueError('crc.RollingCrc: window was not >= 1')
+        c = Calculator(params, backend=backend)
+        if c.implementation == 'binascii':                # needs the byte table
+            c.release()
+            c = Calculator(params, backend='bytecode')
+        self.calculator = c
+        self.window = window
+        self._tab = tab = c._table()
+        nb = c._regbits
+        out = array(_tabtypes[nb][0], bytes(256 * nb // 8))
+        for i in range(8):                                # the outgoing byte, w bytes later: linear, from the powers of 2
+            out[1 << i] = c._shift(tab[1 << i], window)
+        p = 2
+        while p < 256:
+            for i in range(1, p):
+                out[p + i] = out[p] ^ out[i]
+            p <<= 1
+        k = c._shift(c._reg0, window + 1) ^ c._shift(c._reg0, window)   # init moves one byte further, correct it
+        for i in range(256):
+            out[i] ^= k
+        self._out = out
+        self._rsfun = _backend(c.implementation).get('_crc%d_rs' % nb) if c._ptr and _addr32 else None   # ctl holds addresses
+        self._reg = c._reg0
+
+    @property
+    def crc(self):                                        # crc of the present window
+        return self.calculator._value(self._reg)
+
+    def start(self, data, offset=0):                      # starts with the window data[offset:offset + window]
+        c = self.calculator
+        self._reg = c._update(c._reg0, data, offset, offset + self.window)
+        return c._value(self._reg)
+
+    def roll(self, out_byte, in_byte):                    # slides the window by one byte, returns its crc
+        reg = self._reg
+        self._reg = reg = (reg >> 8) ^ self._tab[(reg ^ in_byte) & 0xff] ^ self._out[out_byte]
+        return self.calculator._value(reg)
+
+    def scan(self, data, targets, results=32):            # offsets of the windows of data whose crc is in targets
+        w = self.window
+        n = len(data)
+        if n < w:
+            return
+        c = self.calculator
+        regs = set(c._register(t) for t in targets)
+        self.start(data)
+        reg = self._reg
+        if reg in regs:
+            yield 0
+        if self._rsfun:                                   # results are collected there, at most results per call
+            tg = array('I', sorted(regs))
+            res = array('I', bytes(4 * results))
+            ctl = array('I', (reg, w, w, 0, 0, len(tg), 0, results))
+            ctl[3] = addressof(self._out)
+            ctl[4] = addressof(tg)
+            ctl[6] = addressof(res)
+            while ctl[2] < n:
+                for j in range(self._rsfun(ctl, data, n, self._tab)):
+                    yield res[j]
+            self._reg = ctl[0]
+            return
+        tab, out = self._tab, self._out
+        for i in range(w, n):
+            reg = (reg >> 8) ^ tab[(reg ^ data[i]) & 0xff] ^ out[data[i - w]]
+            if reg in regs:
+                yield i - w + 1
+        self._reg = reg
+
+    def release(self):                                    # gives back the shared table
+        self.calculator.release()
+        self._tab = None